@@ -0,0 +1,329 @@
+"""
+Headless benchmark suite.
+
+Measures the camera rendering, the path finder and its flow fields, the ship movement, the game setup and the inventory
+under SDL's dummy video driver, and writes the results to a JSON file so runs can be compared:
+
+    python benchmarks/run_benchmarks.py                      # writes benchmarks/results/<timestamp>.json
+    python benchmarks/run_benchmarks.py --quick              # smaller maps and fewer repetitions
+    python benchmarks/run_benchmarks.py --compare old.json   # also prints the ratio to an earlier run
+
+All times are in milliseconds. Random grids and queries use fixed seeds, so two runs measure the same work.
+"""
+
+import os
+import sys
+
+# Run without a window or a sound card, before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Add the project root to sys.path to allow imports to work when running the script directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import json
+import platform
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import numpy as np
+import pygame  # type: ignore
+
+from src.inventory import Inventory
+from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE, WORLD_LAYERS
+from src.sprites.animations import AnimationRegistry
+from src.sprites.base import BaseSprite
+from src.sprites.camera.player_camera import PlayerCamera
+from src.sprites.entities.ship_movement import ShipMovement
+from src.sprites.tiles.animated_layer import AnimatedTileLayer
+from src.sprites.tiles.pathfinding import PathFinder
+from src.sprites.tiles.static_layer import StaticTileLayer
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+
+
+def measure(func: Callable[[], object], repeat: int, warmup: int = 1) -> dict[str, float]:
+    """Call `func` `repeat` times after `warmup` calls, and return statistics of the durations in ms."""
+    for _ in range(warmup):
+        func()
+    durations = np.empty(repeat)
+    for index in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations[index] = (time.perf_counter() - start) * 1000
+    p50, p95 = np.percentile(durations, (50, 95))
+    return {
+        "mean_ms": round(float(durations.mean()), 4),
+        "p50_ms": round(float(p50), 4),
+        "p95_ms": round(float(p95), 4),
+        "min_ms": round(float(durations.min()), 4),
+        "runs": repeat,
+    }
+
+
+# Synthetic worlds
+
+
+def make_tile(color: tuple[int, int, int]) -> pygame.Surface:
+    tile = pygame.Surface((TILE_SIZE, TILE_SIZE))
+    tile.fill(color)
+    return tile.convert()
+
+
+def build_world(size: int, seed: int = 0) -> tuple[PlayerCamera, BaseSprite]:
+    """
+    A `size` x `size` world shaped like the game map: a static sea and island layers,
+    animated water on 10% of the tiles and a player in the middle.
+    Return the camera holding the world, and the player.
+    """
+    rng = np.random.default_rng(seed)
+    sprites: pygame.sprite.Group = pygame.sprite.Group()
+    sea, sand = make_tile((30, 90, 160)), make_tile((220, 200, 120))
+    water_frames = [make_tile((40, 100 + 10 * i, 170)) for i in range(4)]
+
+    StaticTileLayer(
+        [(x, y, sea) for y in range(size) for x in range(size)], (size, size), (sprites,), WORLD_LAYERS["bg"]
+    )
+    islands = np.argwhere(rng.random((size, size)) < 0.2)
+    StaticTileLayer([(x, y, sand) for y, x in islands.tolist()], (size, size), (sprites,), WORLD_LAYERS["bg"])
+
+    water = np.argwhere(rng.random((size, size)) < 0.1).tolist()
+    AnimatedTileLayer([(x * TILE_SIZE, y * TILE_SIZE, water_frames) for y, x in water], AnimationRegistry(), (sprites,))
+
+    center = size // 2 * TILE_SIZE
+    player = BaseSprite((center, center), make_tile((255, 0, 0)), (sprites,))
+
+    camera = PlayerCamera(SimpleNamespace(width=size, height=size), (center, center))
+    camera.add(*sprites)
+    camera.build_spatial_index(sprite for sprite in sprites if sprite is not player and sprite.rect is not None)
+    return camera, player
+
+
+def maze_grid(size: int, seed: int = 0) -> np.ndarray:
+    """A perfect maze (one path between any two cells) carved by a depth-first search, 1 is walkable."""
+    rng = np.random.default_rng(seed)
+    grid = np.zeros((size, size), dtype=int)
+    cells = size // 2
+    visited = np.zeros((cells, cells), dtype=bool)
+    stack = [(0, 0)]
+    visited[0, 0] = True
+    grid[1, 1] = 1
+    while stack:
+        x, y = stack[-1]
+        neighbours = [
+            (x + dx, y + dy)
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if 0 <= x + dx < cells and 0 <= y + dy < cells and not visited[y + dy, x + dx]
+        ]
+        if not neighbours:
+            stack.pop()
+            continue
+        nx, ny = neighbours[rng.integers(len(neighbours))]
+        visited[ny, nx] = True
+        grid[2 * ny + 1, 2 * nx + 1] = 1
+        grid[y + ny + 1, x + nx + 1] = 1  # the wall between the two cells
+        stack.append((nx, ny))
+    return grid
+
+
+def island_grid(size: int, seed: int = 0) -> np.ndarray:
+    """An open sea with round islands on about 5% of the tiles, 1 is walkable."""
+    rng = np.random.default_rng(seed)
+    grid = np.ones((size, size), dtype=int)
+    ys, xs = np.ogrid[:size, :size]
+    for x, y, radius in zip(*rng.integers(0, size, (2, size * size // 400)), rng.integers(2, 8, size * size // 400)):
+        grid[(xs - x) ** 2 + (ys - y) ** 2 < radius**2] = 0
+    return grid
+
+
+# Benchmarks
+
+
+def bench_camera_draw(sizes: list[int], scales: list[float], frames: int) -> dict[str, dict]:
+    results = {}
+    for size in sizes:
+        camera, player = build_world(size)
+        assert player.rect is not None
+        center = player.rect.center
+        for scale in scales:
+            camera.scale = scale
+            results[f"{size}x{size}@{scale}"] = measure(lambda: camera.draw(center), frames)
+        camera.empty()
+    return results
+
+
+def bench_pathfinding(size: int, queries: int) -> dict[str, dict]:
+    rng = np.random.default_rng(1)
+    grids = {"open_sea": np.ones((size, size), dtype=int), "maze": maze_grid(size)}
+    results = {}
+    for name, grid in grids.items():
+        walkable = np.argwhere(grid > 0)
+        pairs = [
+            (tuple(walkable[a][::-1].tolist()), tuple(walkable[b][::-1].tolist()))
+            for a, b in rng.integers(len(walkable), size=(queries, 2))
+        ]
+        path_finder = PathFinder(grid, cache_size=queries)
+        pair_iter = iter(pairs)
+        results[f"{name}_{size}x{size}"] = measure(lambda: path_finder.find_path(*next(pair_iter)), queries, 0)
+        start, end = pairs[0]
+        results[f"{name}_{size}x{size}_cached"] = measure(lambda: path_finder.find_path(start, end), queries)
+    return results
+
+
+def bench_algorithms(size: int, queries: int) -> dict[str, dict]:
+    """Long random queries on a large sea with each algorithm of `PathFinder`, and the upkeep of the HPA* graph."""
+    rng = np.random.default_rng(4)
+    grid = island_grid(size)
+    walkable = np.argwhere(grid > 0)[:, ::-1]
+    pairs = [
+        (tuple(walkable[a].tolist()), tuple(walkable[b].tolist()))
+        for a, b in rng.integers(len(walkable), size=(queries, 2))
+    ]
+    results = {}
+    for algorithm in PathFinder.ALGORITHMS:
+        path_finder = PathFinder(grid, cache_size=queries, algorithm=algorithm)
+        pair_iter = iter(pairs)
+        results[f"{algorithm}_{size}x{size}"] = measure(lambda: path_finder.find_path(*next(pair_iter)), queries, 0)
+
+    results[f"hpa_build_{size}x{size}"] = measure(lambda: PathFinder(grid, algorithm="hpa"), 3, 0)
+    hierarchical = PathFinder(grid, algorithm="hpa")
+    cells = iter(rng.integers(size, size=(queries, 2)).tolist())
+
+    def block_next_cell() -> None:
+        x, y = next(cells)
+        hierarchical.set_cell(x, y, 0)
+
+    results[f"hpa_set_cell_{size}x{size}"] = measure(block_next_cell, queries, 0)
+    return results
+
+
+def bench_flow_field(size: int, ships: int) -> dict[str, dict]:
+    """A fleet heading to the same tile: one A* search per ship against one flow field for all of them."""
+    rng = np.random.default_rng(3)
+    results = {}
+    for name, grid in {"open_sea": np.ones((size, size), dtype=int), "maze": maze_grid(size)}.items():
+        walkable = np.argwhere(grid > 0)[:, ::-1]
+        destination = tuple(walkable[0].tolist())
+        starts = [tuple(tile) for tile in walkable[rng.integers(len(walkable), size=ships)].tolist()]
+
+        def a_star() -> None:
+            path_finder = PathFinder(grid)
+            for start in starts:
+                path_finder.find_path(start, destination)
+
+        def flow_field() -> None:
+            PathFinder(grid).flow_field(destination).next_steps(np.array(starts))
+
+        results[f"{name}_{size}x{size}_{ships}_ships_a_star"] = measure(a_star, 3, 0)
+        results[f"{name}_{size}x{size}_{ships}_ships_flow_field"] = measure(flow_field, 3, 0)
+    return results
+
+
+def bench_ship_movement(counts: list[int], steps: int) -> dict[str, dict]:
+    """One simulation step of fleets of ships sailing random 20 tile paths."""
+    rng = np.random.default_rng(2)
+    results = {}
+    for count in counts:
+        movement = ShipMovement()
+        for _ in range(count):
+            ship = movement.add((0, 0))
+            movement.set_path(ship, np.cumsum(rng.integers(-1, 2, (20, 2)), axis=0).tolist())
+        results[f"{count}_ships"] = measure(lambda: movement.update(1 / 60), steps)
+    return results
+
+
+def bench_setup(repeat: int) -> dict[str, dict]:
+    from src.states.game_running import GameRunning
+
+    # The game loads its files relative to the project root
+    previous_directory = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        return {"game_running": measure(lambda: GameRunning(None), repeat, 0)}
+    finally:
+        os.chdir(previous_directory)
+
+
+def bench_inventory(operations: int) -> dict[str, dict]:
+    names = [f"item_{index}" for index in range(50)]
+
+    def single_operations() -> None:
+        inventory = Inventory()
+        for index in range(operations):
+            inventory.add_item(names[index % 50], 2)
+            inventory.use_item(names[index % 50])
+
+    def batch_operations() -> None:
+        inventory = Inventory()
+        for _ in range(operations // 50):
+            inventory.apply_changes((name, 2) for name in names)
+            inventory.apply_changes((name, -1) for name in names)
+
+    return {
+        f"add_and_use_x{operations}": measure(single_operations, 5),
+        f"batch_x{operations}": measure(batch_operations, 5),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    """Run every benchmark and return the results with a description of the machine."""
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    sizes, frames, repeat = ([64, 128], 20, 2) if quick else ([100, 200, 300], 60, 5)
+    results = {
+        "camera_draw": bench_camera_draw(sizes, [1.0, 2.0, 3.0], frames),
+        "pathfinding": bench_pathfinding(64 if quick else 128, 50 if quick else 200),
+        "algorithms": bench_algorithms(256 if quick else 512, 20 if quick else 50),
+        "flow_field": bench_flow_field(64 if quick else 128, 100),
+        "ship_movement": bench_ship_movement([10, 100, 1000], 60),
+        "setup": bench_setup(repeat),
+        "inventory": bench_inventory(1000 if quick else 10000),
+    }
+    pygame.quit()
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, previous: dict) -> None:
+    """Print the mean time of each benchmark next to the one of an earlier run."""
+    for group, benchmarks in current["results"].items():
+        for name, stats in benchmarks.items():
+            before = previous.get("results", {}).get(group, {}).get(name)
+            if before is None:
+                continue
+            ratio = stats["mean_ms"] / before["mean_ms"] if before["mean_ms"] else float("inf")
+            print(f"{group}/{name}: {before['mean_ms']:.3f} -> {stats['mean_ms']:.3f} ms ({ratio:.2f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the headless benchmarks of PyCeas.")
+    parser.add_argument("--output", help="JSON file to write, defaults to benchmarks/results/<timestamp>.json")
+    parser.add_argument("--quick", action="store_true", help="smaller maps and fewer repetitions")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare with")
+    args = parser.parse_args()
+
+    report = run(args.quick)
+    output = args.output or os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
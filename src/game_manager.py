@@ -7,11 +7,13 @@ import sys
 
 import pygame  # type: ignore
 
-from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.settings import FPS, IDLE_FPS, MAX_FRAME_TIME, SCREEN_HEIGHT, SCREEN_WIDTH, SIMULATION_RATE, VSYNC
 
 # import base state for typehint
 from src.states.base_state import BaseState
 from src.states.game_running import GameRunning
+from src.states.loading import Loading
+from src.utils.profiler import profiler
 
 
 class GameStateManager:
@@ -23,21 +25,31 @@ class GameStateManager:
     - Managing a stack of game states, allowing for seamless transitions (e.g., from gameplay to paused state).
     - Handling Pygame events and delegating them to the active state.
     - Running the main game loop with controlled frame rate.
+
+    The simulation advances in fixed steps of `1 / SIMULATION_RATE` seconds, taken from an accumulator
+    of the elapsed time, while frames are rendered at most `FPS` times per second (or with vsync),
+    and `IDLE_FPS` times per second while the window is not focused.
+    `interpolation` tells the states how far the current frame is between the last two steps.
     """
 
     def __init__(self) -> None:
         # init pygame
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # vsync needs a renderer, which pygame only creates for scaled or OpenGL displays
+        flags = pygame.SCALED if VSYNC else 0
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags, vsync=int(VSYNC))
         # pygame.display.set_caption("PyCeas")
 
         self.clock = pygame.Clock()
+        self.fixed_dt = 1 / SIMULATION_RATE
+        self.accumulator = 0.0
+        self.interpolation = 1.0  # 0 renders the previous step, 1 the last one
         self.running = True
         self.events: list[pygame.event.Event] = []
         self.states_stack: list[BaseState] = []
 
-        # instantiate the initial state
-        self.states_stack.append(GameRunning(self))
+        # instantiate the initial state, once its images are decoded
+        self.states_stack.append(Loading(self, GameRunning.image_paths(), lambda: GameRunning(self)))
 
     def __str__(self) -> str:
         """
@@ -70,18 +82,47 @@ class GameStateManager:
                 case pygame.QUIT:
                     pygame.quit()
                     sys.exit()
+                case pygame.KEYDOWN if event.key == pygame.K_F3:  # Toggle the frame-time overlay
+                    profiler.visible = not profiler.visible
+                case pygame.KEYDOWN if event.key == pygame.K_F4:  # Dump the recorded frame times
+                    print(f"Frame times written to {profiler.dump_csv()}")
+
+    def _frame_cap(self) -> int:
+        """The maximum frame rate of the next frame, 0 for none."""
+        if not pygame.key.get_focused():
+            return IDLE_FPS
+        return 0 if VSYNC else FPS
 
     def run(self) -> None:
         """main loop of the game"""
         while self.running:
-            self._handle_events()
+            # Sleeps until the next frame is due, then adds the elapsed time to the simulation budget
+            frame_time = min(self.clock.tick(self._frame_cap()) / 1000, MAX_FRAME_TIME)
+            self.accumulator += frame_time
+
+            profiler.begin_frame()
+            with profiler.section("events"):
+                self._handle_events()
 
             # give the pygame events to each state
             # to ensure that pygame.event.get() is only called once per frame
-            self.states_stack[-1].update(self.events)
-
-            self.states_stack[-1].render(self.screen)
+            with profiler.section("update"):
+                self.states_stack[-1].update(self.events)
+                while self.accumulator >= self.fixed_dt:
+                    self.states_stack[-1].fixed_update(self.fixed_dt)
+                    self.accumulator -= self.fixed_dt
+                self.interpolation = self.accumulator / self.fixed_dt
+
+            with profiler.section("render"):
+                self.states_stack[-1].render(self.screen)
+
+            # The states present the frame themselves, the overlay area is updated on top of it,
+            # with the area of the previous overlay so hiding it is presented too
+            previous_overlay_rect = profiler.drawn_rect
+            overlay_rect = profiler.draw(self.screen)
+            overlay_rects = [rect for rect in (previous_overlay_rect, overlay_rect) if rect is not None]
+            if overlay_rects:
+                pygame.display.update(overlay_rects)
+            profiler.end_frame()
 
-            # magic value, use 'a' FPS const in settings or delta time
-            self.clock.tick()
             pygame.display.set_caption(f"{self.clock.get_fps():.2f} FPS")
@@ -3,9 +3,50 @@ inventory class for the players
 this file contain types of items, like Chest
 """
 
+from collections.abc import Iterable, Mapping
+from enum import Enum
+
 from src.utils.messaging import get_message
 
 
+class ResultCode(Enum):
+    """Outcome of an inventory operation, the value is the key of its message in `data/messages.json`"""
+
+    ADD_SUCCESS = "add_success"
+    ADD_FAIL = "add_fail"
+    REMOVE_SUCCESS = "remove_success"
+    REMOVE_FAIL = "remove_fail"
+    USE_SUCCESS = "use_success"
+    USE_FAIL = "use_fail"
+    BUY_SUCCESS = "buy_success"
+    BUY_FAIL = "buy_fail"
+    SELL_SUCCESS = "sell_success"
+    SELL_FAIL = "sell_fail"
+    BATCH_SUCCESS = "batch_success"
+    BATCH_FAIL = "batch_fail"
+    BATCH_INVALID = "batch_invalid"
+
+
+class InventoryResult(str):
+    """
+    The message returned by an inventory operation, carrying its `ResultCode`.
+
+    It is still the formatted message for the GUI, but callers check `code` (or `success`)
+    instead of comparing it with another message.
+    """
+
+    code: ResultCode
+
+    def __new__(cls, code: ResultCode, category: str, **kwargs) -> "InventoryResult":
+        result = super().__new__(cls, get_message(category, code.value, **kwargs))
+        result.code = code
+        return result
+
+    @property
+    def success(self) -> bool:
+        return self.code.value.endswith("_success")
+
+
 class Chest:
     """contain loot, and worth"""
 
@@ -35,45 +76,73 @@ class Inventory:
         self.quests: list[Quest] = []
 
     # General item management
-    def add_item(self, item_name: str, quantity: int) -> str:
+    def add_item(self, item_name: str, quantity: int) -> InventoryResult:
         """Add an item to the inventory"""
         if item_name in self.items:
             self.items[item_name] += quantity
-            return get_message("inventory", "add_success", item=item_name, quantity=quantity)
         else:
             self.items[item_name] = quantity
-            return get_message("inventory", "add_success", item=item_name, quantity=quantity)
+        return InventoryResult(ResultCode.ADD_SUCCESS, "inventory", item=item_name, quantity=quantity)
 
-    def remove_item(self, item_name: str, quantity: int) -> str:
-        """Remove an item from the inventory. Return True if successful."""
+    def remove_item(self, item_name: str, quantity: int) -> InventoryResult:
+        """Remove an item from the inventory. The result code tells if it was successful."""
         if item_name in self.items and self.items[item_name] >= quantity:
             self.items[item_name] -= quantity
             if self.items[item_name] == 0:
                 del self.items[item_name]
-            return get_message("inventory", "remove_success", item=item_name, quantity=quantity)
-        return get_message("inventory", "remove_fail", item=item_name, quantity=quantity)
+            return InventoryResult(ResultCode.REMOVE_SUCCESS, "inventory", item=item_name, quantity=quantity)
+        return InventoryResult(ResultCode.REMOVE_FAIL, "inventory", item=item_name, quantity=quantity)
 
-    def use_item(self, item_name: str) -> str:
+    def use_item(self, item_name: str) -> InventoryResult:
         """Use an item, applying its effect. Return a message."""
-        if self.remove_item(item_name, 1) == get_message("inventory", "remove_success", item=item_name, quantity=1):
-            return get_message("inventory", "use_success", item=item_name)
-        return get_message("inventory", "use_fail", item=item_name)
+        if self.remove_item(item_name, 1).code is ResultCode.REMOVE_SUCCESS:
+            return InventoryResult(ResultCode.USE_SUCCESS, "inventory", item=item_name)
+        return InventoryResult(ResultCode.USE_FAIL, "inventory", item=item_name)
 
-    def buy_item(self, item_name, quantity):
+    def buy_item(self, item_name: str, quantity: int) -> InventoryResult:
         if item_name in self.items:
             self.items[item_name] += quantity
-            return get_message("shop_inventory", "buy_success", item=item_name, quantity=quantity)
         else:
             self.items[item_name] = quantity
-            return get_message("shop_inventory", "buy_success", item=item_name, quantity=quantity)
+        return InventoryResult(ResultCode.BUY_SUCCESS, "shop_inventory", item=item_name, quantity=quantity)
 
-    def sell_item(self, item_name, quantity):
+    def sell_item(self, item_name: str, quantity: int) -> InventoryResult:
         if item_name in self.items and self.items[item_name] >= quantity:
             self.items[item_name] -= quantity
             if self.items[item_name] == 0:
                 del self.items[item_name]
-            return get_message("shop_inventory", "sell_success", item=item_name, quantity=quantity)
-        return get_message("shop_inventory", "sell_fail", item=item_name, quantity=quantity)
+            return InventoryResult(ResultCode.SELL_SUCCESS, "shop_inventory", item=item_name, quantity=quantity)
+        return InventoryResult(ResultCode.SELL_FAIL, "shop_inventory", item=item_name, quantity=quantity)
+
+    def apply_changes(self, changes: Mapping[str, int] | Iterable[tuple[str, int]]) -> InventoryResult:
+        """
+        Apply many item changes at once, all or nothing.
+
+        Positive quantities are added like `add_item`, negative ones removed like `remove_item`,
+        and changes to the same item are summed first; items whose changes cancel out are left
+        untouched. If a quantity is not an integer, nothing is changed and the result is
+        `BATCH_INVALID`; if any item would drop below zero, it is `BATCH_FAIL`.
+        Only one message is formatted.
+        """
+        deltas: dict[str, int] = {}
+        for item_name, quantity in changes.items() if isinstance(changes, Mapping) else changes:
+            if not isinstance(quantity, int) or isinstance(quantity, bool):
+                return InventoryResult(ResultCode.BATCH_INVALID, "inventory", item=item_name)
+            deltas[item_name] = deltas.get(item_name, 0) + quantity
+        deltas = {item_name: quantity for item_name, quantity in deltas.items() if quantity}
+
+        for item_name, quantity in deltas.items():
+            if quantity < 0 and self.items.get(item_name, 0) + quantity < 0:
+                return InventoryResult(ResultCode.BATCH_FAIL, "inventory", item=item_name)
+
+        items = self.items
+        for item_name, quantity in deltas.items():
+            remaining = items.get(item_name, 0) + quantity
+            if remaining == 0:
+                del items[item_name]
+            else:
+                items[item_name] = remaining
+        return InventoryResult(ResultCode.BATCH_SUCCESS, "inventory", count=len(deltas))
 
     def get_items(self) -> dict[str, int]:
         """Return a copy of the items dictionary."""
@@ -7,9 +7,14 @@ import pygame.freetype  # type: ignore
 SCREEN_WIDTH, SCREEN_HEIGHT = 1280, 720
 TILE_SIZE = 16
 ANIMATION_SPEED = 4
+SHIP_SPEED = 8  # tiles per second
 
 WORLD_LAYERS = {"water": 0, "bg": 1, "main": 2, "top": 3}
-FPS = 30
+FPS = 30  # frame cap, unless VSYNC is on
+SIMULATION_RATE = 60  # fixed updates per second, independent of the frame rate
+IDLE_FPS = 5  # frame cap while the window is not focused
+VSYNC = False  # present the frames in sync with the display refresh instead of capping them at FPS
+MAX_FRAME_TIME = 0.25  # longest frame simulated, in seconds, so a stall does not trigger a burst of updates
 
 
 # For some imports like pygame.freetype, Mypy can't infer the type of this attribute, so we suppress the error.
@@ -5,6 +5,48 @@ from src.settings import ANIMATION_SPEED, WORLD_LAYERS
 from src.sprites.base import BaseSprite
 
 
+class AnimationTimeline:
+    """
+    A single animation clock shared by everything animated with the same frames.
+
+    The clock is advanced once per update, whatever the number of tiles showing it: the
+    `AnimatedTileLayer` reads it when drawing, shifting each tile along it by a phase offset (in frames).
+    """
+
+    def __init__(self, frames: list[pygame.Surface]) -> None:
+        self.frames = frames
+        self.frame_index: float = 0.0
+
+    def current_frame(self, phase: int = 0) -> pygame.Surface:
+        """Return the frame currently shown with the given phase."""
+        return self.frames[(int(self.frame_index) + phase) % len(self.frames)]
+
+    def update(self, dt: float) -> None:
+        """Advance the clock by `dt` seconds."""
+        self.frame_index += ANIMATION_SPEED * dt
+
+
+class AnimationRegistry:
+    """Keeps one `AnimationTimeline` per set of frames, and advances all of them once per frame."""
+
+    def __init__(self) -> None:
+        self.timelines: dict[tuple[pygame.Surface, ...], AnimationTimeline] = {}
+
+    def timeline(self, frames: list[pygame.Surface]) -> AnimationTimeline:
+        """Return the timeline of `frames`, creating it if needed."""
+        key = tuple(frames)
+        timeline = self.timelines.get(key)
+        if timeline is None:
+            timeline = AnimationTimeline(frames)
+            self.timelines[key] = timeline
+        return timeline
+
+    def update(self, dt: float) -> None:
+        """Advance every timeline by `dt` seconds."""
+        for timeline in self.timelines.values():
+            timeline.update(dt)
+
+
 class AnimatedSprites(BaseSprite):
     def __init__(
         self,
@@ -1,8 +1,14 @@
+from collections.abc import Iterable
+
 import pygame  # ignore
+from pygame.sprite import Sprite  # type: ignore
 
 from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE, WORLD_LAYERS
 from src.sprites.camera.group import AllSprites
+from src.sprites.camera.spatial_index import SpatialIndex
+from src.sprites.tiles.animated_layer import AnimatedTileLayer
 from src.sprites.tiles.grid_manager import GridManager
+from src.sprites.tiles.static_layer import StaticTileLayer
 
 
 class PlayerCamera(AllSprites):
@@ -14,13 +20,26 @@ class PlayerCamera(AllSprites):
     It supports rendering sprites at different layers (background, main, foreground)
     and scales sprites dynamically based on the camera's zoom level.
 
+    Static sprites can be registered in a spatial index with `build_spatial_index`,
+    after which only the ones inside the camera view are visited when drawing.
+
     Attributes:
         display_surface (pygame.Surface): The surface to render the sprites on.
         offset (pygame.math.Vector2): The camera's offset, calculated relative to the player's position.
         scale (float): The scaling factor for rendering sprites.
+        grid (GridManager | None): The grid manager of the game state, if one was given.
     """
 
-    def __init__(self, tmx_map=None, player_start_pos=None):
+    # Draw order of a sprite: background, main and foreground layers, then insertion order
+    _LAYER_SHIFT = 32
+
+    def __init__(self, tmx_map=None, player_start_pos=None, grid: GridManager | None = None):
+        # Bookkeeping used by add_internal, which may run during the group initialization
+        self._draw_order: dict[Sprite, int] = {}
+        self._next_order = 0
+        self._dynamic_sprites: dict[Sprite, None] = {}  # sprites not in the spatial index
+        self.spatial_index: SpatialIndex | None = None
+
         super().__init__()
         self.display_surface = pygame.display.get_surface()
         if not self.display_surface:
@@ -35,9 +54,88 @@ class PlayerCamera(AllSprites):
         self.tmx_map = tmx_map
         self.offset = pygame.math.Vector2()
         self.scale = 2.0
-        self.grid = GridManager(tmx_map, tile_size=TILE_SIZE)
+        self.grid = grid  # shared with the game state, building a second one would double the grid setup
         self.player_start_pos = player_start_pos
 
+        # Scaled images keyed by (source surface, scaled size), only valid for `_cached_scale`
+        self._scaled_cache: dict[tuple[pygame.Surface, tuple[int, int]], pygame.Surface] = {}
+        self._cached_scale = self.scale
+
+    def add_internal(self, sprite: Sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        if sprite not in self._draw_order:
+            z = getattr(sprite, "z", WORLD_LAYERS["main"])
+            layer_rank = 0 if z < WORLD_LAYERS["main"] else 1 if z == WORLD_LAYERS["main"] else 2
+            self._draw_order[sprite] = (layer_rank << self._LAYER_SHIFT) | self._next_order
+            self._next_order += 1
+            self._dynamic_sprites[sprite] = None
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        super().remove_internal(sprite)
+        self._draw_order.pop(sprite, None)
+        self._dynamic_sprites.pop(sprite, None)
+        if self.spatial_index is not None:
+            self.spatial_index.remove(sprite)
+
+    def build_spatial_index(self, static_sprites: Iterable[Sprite], bucket_size: int = TILE_SIZE * 8) -> None:
+        """
+        Index sprites that never move so that drawing only visits the ones inside the camera view.
+
+        Sprites of the group that are not indexed (e.g. the player) are still drawn every frame.
+
+        :param static_sprites: Sprites of this group whose rect will not change.
+        :param bucket_size: The size of a spatial index bucket in world pixels.
+        """
+        static_sprites = [sprite for sprite in static_sprites if sprite in self._draw_order]
+        self.spatial_index = SpatialIndex(bucket_size)
+        self.spatial_index.build(static_sprites, self._draw_order.__getitem__)
+        for sprite in static_sprites:
+            self._dynamic_sprites.pop(sprite, None)
+
+    def get_view_rect(self) -> pygame.FRect:
+        """Return the area of the world, in world pixels, currently covered by the camera."""
+        return pygame.FRect(
+            -self.offset.x / self.scale,
+            -self.offset.y / self.scale,
+            SCREEN_WIDTH / self.scale,
+            SCREEN_HEIGHT / self.scale,
+        )
+
+    def _get_visible_sprites(self, view_rect: pygame.FRect) -> list[tuple[int, Sprite]]:
+        """Return the (draw order, sprite) pairs around `view_rect`, sorted by draw order."""
+        if self.spatial_index is not None:
+            visible = self.spatial_index.query(view_rect)
+        else:
+            visible = []
+        draw_order = self._draw_order
+        dynamic = [
+            (draw_order[sprite], sprite)
+            for sprite in self._dynamic_sprites
+            if sprite.rect is not None and view_rect.colliderect(sprite.rect)
+        ]
+        if dynamic:
+            visible.extend(dynamic)
+            visible.sort(key=lambda entry: entry[0])
+        return visible
+
+    def _get_scaled_image(self, image: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Return `image` scaled to `size`, reusing the result of earlier frames.
+
+        Most sprites share a handful of tile surfaces, so the cache stays small while saving
+        a `pygame.transform.scale` call per sprite per frame. It is emptied whenever the zoom changes.
+        """
+        if self._cached_scale != self.scale:
+            self._scaled_cache.clear()
+            self._cached_scale = self.scale
+
+        key = (image, size)
+        scaled_image = self._scaled_cache.get(key)
+        if scaled_image is None:
+            scaled_image = pygame.transform.scale(image, size)
+            self._scaled_cache[key] = scaled_image
+        return scaled_image
+
     def draw(self, player_center, show_grid=False):
         # Calculate offsets
         self.offset.x = -(player_center[0] * self.scale - SCREEN_WIDTH / 2)
@@ -46,38 +144,44 @@ class PlayerCamera(AllSprites):
         # print(f"Player Center: {player_center}")
         # print(f"Camera Offset: {self.offset}")
 
-        # Separate sprites into layers
-        background_sprites = [sprite for sprite in self if sprite.z < WORLD_LAYERS["main"]]
-        main_sprites = [sprite for sprite in self if sprite.z == WORLD_LAYERS["main"]]
-        foreground_sprites = [sprite for sprite in self if sprite.z > WORLD_LAYERS["main"]]
-
-        # Render each layer
-        for layer in (background_sprites, main_sprites, foreground_sprites):
-            for sprite in layer:
-                # Scale the image
-                scaled_image = pygame.transform.scale(
-                    sprite.image,
-                    (
-                        int(sprite.rect.width * self.scale),
-                        int(sprite.rect.height * self.scale),
-                    ),
-                )
+        # Ensure display_surface is valid before blitting
+        if self.display_surface is None:
+            raise ValueError("self.display_surface cannot be None")
 
-                # Adjust the rect to the new scale
-                scaled_rect = scaled_image.get_rect(
-                    center=(
-                        int(sprite.rect.center[0] * self.scale),
-                        int(sprite.rect.center[1] * self.scale),
-                    )
-                )
+        # Grow the view by a tile to account for the rounding of scaled positions
+        view_rect = self.get_view_rect().inflate(TILE_SIZE * 2, TILE_SIZE * 2)
+
+        # Only the sprites around the view, already sorted into background, main and foreground layers
+        for _, sprite in self._get_visible_sprites(view_rect):
+            if isinstance(sprite, (StaticTileLayer, AnimatedTileLayer)):
+                sprite.draw(self.display_surface, self.offset, self.scale, view_rect)
+                continue
+
+            image, rect = sprite.image, sprite.rect
+            if image is None or rect is None:
+                continue
 
-                # Add offset to the rect position
-                scaled_rect.topleft = (
-                    scaled_rect.topleft[0] + int(self.offset.x),
-                    scaled_rect.topleft[1] + int(self.offset.y),
+            # Scale the image (cached per zoom level)
+            scaled_image = self._get_scaled_image(
+                image,
+                (
+                    int(rect.width * self.scale),
+                    int(rect.height * self.scale),
+                ),
+            )
+
+            # Adjust the rect to the new scale
+            scaled_rect = scaled_image.get_rect(
+                center=(
+                    int(rect.center[0] * self.scale),
+                    int(rect.center[1] * self.scale),
                 )
+            )
+
+            # Add offset to the rect position
+            scaled_rect.topleft = (
+                scaled_rect.topleft[0] + int(self.offset.x),
+                scaled_rect.topleft[1] + int(self.offset.y),
+            )
 
-                # Ensure display_surface is valid before blitting
-                if self.display_surface is None:
-                    raise ValueError("self.display_surface cannot be None")
-                self.display_surface.blit(scaled_image, scaled_rect.topleft)
+            self.display_surface.blit(scaled_image, scaled_rect.topleft)
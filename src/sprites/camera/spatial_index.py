@@ -0,0 +1,112 @@
+from collections.abc import Callable, Iterable
+
+import pygame  # type: ignore
+from pygame.sprite import Sprite  # type: ignore
+
+from src.settings import TILE_SIZE
+
+
+class SpatialIndex:
+    """
+    A uniform grid of buckets holding static sprites, used by the camera to only visit what is on screen.
+
+    Each bucket covers `bucket_size` x `bucket_size` world pixels and keeps its sprites as
+    (draw order, sprite) pairs sorted by draw order, so a query only has to merge a few
+    already sorted runs. The cost of a query depends on the size of the queried area,
+    not on the size of the map.
+
+    Attributes:
+        bucket_size (int): The width and height of a bucket in world pixels.
+        buckets (dict[tuple[int, int], list[tuple[int, Sprite]]]): The sprites of each bucket.
+    """
+
+    def __init__(self, bucket_size: int = TILE_SIZE * 8) -> None:
+        if bucket_size <= 0:
+            raise ValueError("bucket_size must be a positive number of pixels")
+        self.bucket_size = bucket_size
+        self.buckets: dict[tuple[int, int], list[tuple[int, Sprite]]] = {}
+        self._sprites: dict[Sprite, tuple[int, list[tuple[int, int]]]] = {}
+        # Sprites spanning several buckets have to be de-duplicated when querying
+        self._has_spanning_sprites = False
+
+    def __contains__(self, sprite: Sprite) -> bool:
+        return sprite in self._sprites
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def _bucket_range(self, rect: pygame.Rect | pygame.FRect) -> tuple[int, int, int, int]:
+        """Return the first and last bucket columns and rows touched by `rect`."""
+        size = self.bucket_size
+        start_x = int(rect.left // size)
+        start_y = int(rect.top // size)
+        # A rect covers [left, right), so the last pixel column is right - 1
+        end_x = int((rect.right - 1) // size) if rect.width > 0 else start_x
+        end_y = int((rect.bottom - 1) // size) if rect.height > 0 else start_y
+        return start_x, start_y, end_x, end_y
+
+    def build(self, sprites: Iterable[Sprite], order_key: Callable[[Sprite], int]) -> None:
+        """
+        Replace the content of the index with `sprites`.
+
+        :param sprites: The static sprites to index, they must have a `rect`.
+        :param order_key: Returns the draw order of a sprite, lower values are drawn first.
+        """
+        self.buckets.clear()
+        self._sprites.clear()
+        self._has_spanning_sprites = False
+        for sprite in sorted(sprites, key=order_key):
+            self._insert(sprite, order_key(sprite))
+
+    def insert(self, sprite: Sprite, order: int) -> None:
+        """Add a single sprite to the index, keeping every bucket sorted by draw order."""
+        if sprite in self._sprites:
+            self.remove(sprite)
+        self._insert(sprite, order)
+        for key in self._sprites[sprite][1]:
+            self.buckets[key].sort(key=lambda entry: entry[0])
+
+    def _insert(self, sprite: Sprite, order: int) -> None:
+        if sprite.rect is None:
+            raise ValueError("Only sprites with a rect can be indexed")
+        start_x, start_y, end_x, end_y = self._bucket_range(sprite.rect)
+        keys = [(x, y) for y in range(start_y, end_y + 1) for x in range(start_x, end_x + 1)]
+        for key in keys:
+            self.buckets.setdefault(key, []).append((order, sprite))
+        if len(keys) > 1:
+            self._has_spanning_sprites = True
+        self._sprites[sprite] = (order, keys)
+
+    def remove(self, sprite: Sprite) -> None:
+        """Remove a sprite from the index, if present."""
+        entry = self._sprites.pop(sprite, None)
+        if entry is None:
+            return
+        order, keys = entry
+        for key in keys:
+            bucket = self.buckets[key]
+            bucket.remove((order, sprite))
+            if not bucket:
+                del self.buckets[key]
+
+    def query(self, rect: pygame.Rect | pygame.FRect) -> list[tuple[int, Sprite]]:
+        """
+        Return the (draw order, sprite) pairs of the buckets overlapping `rect`, sorted by draw order.
+
+        Sprites near the border of `rect` may be returned even if they do not overlap it,
+        the caller only needs a cheap superset of what is visible.
+        """
+        start_x, start_y, end_x, end_y = self._bucket_range(rect)
+        buckets = self.buckets
+        visible: list[tuple[int, Sprite]] = []
+        for y in range(start_y, end_y + 1):
+            for x in range(start_x, end_x + 1):
+                bucket = buckets.get((x, y))
+                if bucket:
+                    visible.extend(bucket)
+
+        if self._has_spanning_sprites:
+            visible = list(dict.fromkeys(visible))
+        # Buckets are sorted runs, which Timsort merges in close to linear time
+        visible.sort(key=lambda entry: entry[0])
+        return visible
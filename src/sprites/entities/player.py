@@ -1,10 +1,14 @@
+from collections import deque
+from collections.abc import Iterable
+
 import pygame  # type: ignore
 from pygame import FRect, Surface  # type: ignore
 from pygame.sprite import Group  # type: ignore
 
 from src.inventory import Inventory
-from src.settings import TILE_SIZE
+from src.settings import SHIP_SPEED, TILE_SIZE
 from src.sprites.base import BaseSprite
+from src.sprites.entities.ship_movement import ShipMovement
 
 
 class Player(BaseSprite):
@@ -17,26 +21,34 @@ class Player(BaseSprite):
         pos: tuple[int, int],
         frames: list[Surface],
         groups: tuple[Group, ...] = (),
+        movement: ShipMovement | None = None,
+        speed: float = SHIP_SPEED,
     ) -> None:
         """
         Initialize the player.
         :param pos: Starting position of the player.
         :param frames: A list of frames for player animation.
         :param groups: Sprite groups the player belongs to.
+        :param movement: The movement system moving the ships of the game, which then updates it.
+            Without one, the player moves itself in `update`.
+        :param speed: The speed of the player in tiles per second.
         """
 
         # Initialize the player sprite
         player_square = frames[0] if isinstance(frames, (list, tuple)) and frames else Surface((TILE_SIZE, TILE_SIZE))
         player_square.fill("red")
         super().__init__(pos=pos, surf=player_square, groups=groups)
+        self.rect = player_square.get_frect(topleft=pos)  # moves by fractions of a tile
 
         # Animation frames
         self.frames = frames
         self.frame_index: float = 0.0
 
         self.position = pos
-        # In your __init__ method
-        self.path: list[tuple[int, int]] = []  # Stores the path to the destination tile
+        # The ship of the player, moved along its path by the movement system
+        self._owns_movement = movement is None
+        self.movement = ShipMovement() if movement is None else movement
+        self.ship = self.movement.add(pos, speed, sprite=self)
 
         # Inventory system
         self.inventory = Inventory()
@@ -44,6 +56,20 @@ class Player(BaseSprite):
         # Input handling
         self.mouse_have_been_pressed: bool = False
 
+    @property
+    def path(self) -> deque[tuple[int, int]]:
+        """The tiles the player still has to go through to reach its destination."""
+        return self.movement.path(self.ship)
+
+    @path.setter
+    def path(self, path: Iterable) -> None:
+        self.movement.set_path(self.ship, path)
+
+    @property
+    def waypoints(self) -> list[tuple[int, int]]:
+        """The tile the player is heading to, then the rest of its path: set as `path`, it resumes the trip."""
+        return self.movement.waypoints(self.ship)
+
     # def get_neighbor_tiles(self, grid, blocked_tiles=None):
     #     """Calculate and return all valid adjacent (neighbor) tiles for the player."""
     #     if blocked_tiles is None:
@@ -77,15 +103,16 @@ class Player(BaseSprite):
             return
         self.mouse_have_been_pressed = True
 
-        # Calculate the tile coordinates from the grid with camera offset and scale
-        player_tile = (self.rect.x // grid.tile_size, self.rect.y // grid.tile_size)
+        # Calculate the tile coordinates from the grid with camera offset and scale,
+        # the player starts from the tile it is closest to when it is between two tiles
+        player_tile = (round(self.rect.x / grid.tile_size), round(self.rect.y / grid.tile_size))
         target_tile = grid.get_tile_coordinates(mouse_pos, camera_offset, camera_scale)
 
         # Find a path using A* algorithm
         path = grid.find_path(player_tile, target_tile)
         if path and len(path) > 1:
-            # Move to the next tile in the path
-            self.path = path[1:]
+            # Sail through the tiles of the path, starting by the closest one
+            self.path = path
 
     def update(
             self, dt: float, grid=None, camera_offset: pygame.math.Vector2 | None = None,
@@ -96,7 +123,6 @@ class Player(BaseSprite):
             # this method is not used, could be useful when implementing a player switching system
             # self.get_neighbor_tiles(grid)
             self.input(grid, camera_offset, camera_scale)  # Handle input with camera offset and scale
-            if self.path:
-                next_tile = self.path.pop(0)
-                self.rect.topleft = (next_tile[0] * grid.tile_size, next_tile[1] * grid.tile_size)
+        if self._owns_movement:
+            self.movement.update(dt)
         self.animate(dt)
@@ -0,0 +1,151 @@
+from collections import deque
+from collections.abc import Iterable
+
+import numpy as np
+from pygame.sprite import Sprite  # type: ignore
+
+from src.settings import SHIP_SPEED, TILE_SIZE
+
+
+class ShipMovement:
+    """
+    Moves every ship along its path, in one vectorized pass per simulation step.
+
+    Each ship is a row of NumPy arrays: its position in world pixels, the waypoint it is heading to,
+    its speed in tiles per second and whether it is moving. The remaining waypoints of a ship are kept
+    in a deque, only touched when the ship reaches a waypoint. A ship covers `speed` tiles per second
+    whatever the frame rate, and a ship faster than a tile per step goes through several waypoints
+    in the same step.
+
+    A ship can be attached to a sprite, whose `rect.topleft` follows the ship.
+
+    Attributes:
+        tile_size (int): The size of a tile in world pixels.
+        position (np.ndarray): The (x, y) top left corner of each ship in world pixels.
+        target (np.ndarray): The (x, y) waypoint each ship is heading to, in world pixels.
+        speed (np.ndarray): The speed of each ship in tiles per second.
+        moving (np.ndarray): Whether each ship has a waypoint to reach.
+    """
+
+    def __init__(self, tile_size: int = TILE_SIZE, capacity: int = 64) -> None:
+        self.tile_size = tile_size
+        self.position: np.ndarray = np.zeros((capacity, 2))
+        self.target: np.ndarray = np.zeros((capacity, 2))
+        self.speed: np.ndarray = np.zeros(capacity)
+        self.moving: np.ndarray = np.zeros(capacity, dtype=bool)
+        self.paths: list[deque[tuple[int, int]]] = []
+        self.sprites: list[Sprite | None] = []
+        self._free: list[int] = []  # rows of removed ships, reused by `add`
+
+    def __len__(self) -> int:
+        return len(self.paths) - len(self._free)
+
+    def add(self, position: tuple[float, float], speed: float = SHIP_SPEED, sprite: Sprite | None = None) -> int:
+        """
+        Add a ship at `position` (in world pixels) and return its index.
+
+        :param position: The top left corner of the ship in world pixels.
+        :param speed: The speed of the ship in tiles per second.
+        :param sprite: A sprite whose rect follows the ship.
+        """
+        if self._free:
+            ship = self._free.pop()
+            self.paths[ship] = deque()
+            self.sprites[ship] = sprite
+        else:
+            ship = len(self.paths)
+            if ship == len(self.speed):
+                self._grow()
+            self.paths.append(deque())
+            self.sprites.append(sprite)
+        self.position[ship] = position
+        self.target[ship] = position
+        self.speed[ship] = speed
+        self.moving[ship] = False
+        return ship
+
+    def _grow(self) -> None:
+        """Double the capacity of the arrays."""
+        self.position = np.concatenate((self.position, np.zeros_like(self.position)))
+        self.target = np.concatenate((self.target, np.zeros_like(self.target)))
+        self.speed = np.concatenate((self.speed, np.zeros_like(self.speed)))
+        self.moving = np.concatenate((self.moving, np.zeros_like(self.moving)))
+
+    def remove(self, ship: int) -> None:
+        """Stop moving the ship `ship`, its index is reused by the next `add`."""
+        self.paths[ship].clear()
+        self.sprites[ship] = None
+        self.moving[ship] = False
+        self._free.append(ship)
+
+    def path(self, ship: int) -> deque[tuple[int, int]]:
+        """The waypoints (in tiles) the ship `ship` still has to reach, after its current target."""
+        return self.paths[ship]
+
+    def waypoints(self, ship: int) -> list[tuple[int, int]]:
+        """The tile the ship `ship` is heading to, if it is moving, followed by the rest of its path."""
+        if not self.moving[ship]:
+            return list(self.paths[ship])
+        x, y = self.target[ship] // self.tile_size
+        return [(int(x), int(y)), *self.paths[ship]]
+
+    def set_path(self, ship: int, path: Iterable) -> None:
+        """
+        Replace the waypoints of the ship `ship` by `path`, a sequence of (x, y) tiles.
+
+        The ship starts from where its sprite is, if it has one, so a sprite moved by hand (e.g. by a
+        quick-load) is followed, then heads to the first waypoint.
+        """
+        sprite = self.sprites[ship]
+        if sprite is not None and sprite.rect is not None:
+            self.position[ship] = sprite.rect.topleft
+        self.paths[ship] = deque((int(x), int(y)) for x, y in path)
+        self.target[ship] = self.position[ship]
+        self._next_waypoint(ship)
+
+    def _next_waypoint(self, ship: int) -> bool:
+        """Head the ship to its next waypoint, return False if its path is over."""
+        path = self.paths[ship]
+        if not path:
+            self.moving[ship] = False
+            return False
+        x, y = path.popleft()
+        self.target[ship] = (x * self.tile_size, y * self.tile_size)
+        self.moving[ship] = True
+        return True
+
+    def update(self, dt: float) -> None:
+        """Advance every moving ship by `dt` seconds along its path."""
+        ships = np.flatnonzero(self.moving[: len(self.paths)])
+        if ships.size == 0:
+            return
+        moved = ships
+        budget = self.speed[ships] * self.tile_size * dt  # pixels left to travel this step
+
+        while ships.size:
+            delta = self.target[ships] - self.position[ships]
+            distance = np.hypot(delta[:, 0], delta[:, 1])
+            arrived = budget >= distance
+
+            # Ships short of their waypoint move towards it and are done for this step
+            en_route = ~arrived
+            if en_route.any():
+                fraction = budget[en_route] / distance[en_route]
+                self.position[ships[en_route]] += delta[en_route] * fraction[:, None]
+
+            # The others snap to it and go on to the next waypoint with the distance left
+            ships, budget = ships[arrived], budget[arrived] - distance[arrived]
+            self.position[ships] = self.target[ships]
+            keep = np.array([self._next_waypoint(ship) for ship in ships.tolist()], dtype=bool)
+            if keep.size:
+                ships, budget = ships[keep], budget[keep]
+
+        self._sync_sprites(moved)
+
+    def _sync_sprites(self, ships: np.ndarray) -> None:
+        """Move the sprites of `ships` to the position of their ship."""
+        sprites = self.sprites
+        for ship, position in zip(ships.tolist(), self.position[ships].tolist()):
+            sprite = sprites[ship]
+            if sprite is not None:
+                sprite.rect.topleft = position
@@ -0,0 +1,145 @@
+from collections.abc import Iterable
+
+import numpy as np
+import pygame  # type: ignore
+from pygame import Surface  # type: ignore
+from pygame.sprite import Group, Sprite  # type: ignore
+
+from src.settings import WORLD_LAYERS
+from src.sprites.animations import AnimationRegistry, AnimationTimeline
+
+
+class AnimatedTileLayer(Sprite):
+    """
+    A layer of animated tiles (water, coast), stored as NumPy columns instead of one sprite per tile.
+
+    Each tile is a position, the index of its set of frames and a phase on the timeline of that set,
+    a few bytes instead of a full `BaseSprite`. The frames are driven by the shared timelines of an
+    `AnimationRegistry`, and the camera draws the tiles inside its view with a single `fblits` call.
+
+    Attributes:
+        rect (FRect): The area covered by the tiles in world pixels.
+        z (int): The layer index for rendering.
+        x, y (np.ndarray): The top left corner of each tile in world pixels.
+        frame_set (np.ndarray): The index of the frames of each tile in `timelines`.
+        phase (np.ndarray): The offset of each tile on the timeline of its frames, in frames.
+        timelines (list[AnimationTimeline]): The timeline of each set of frames.
+    """
+
+    def __init__(
+        self,
+        tiles: Iterable[tuple[int, int, list[Surface]]],
+        registry: AnimationRegistry,
+        groups: tuple[Group, ...] = (),
+        z: int = WORLD_LAYERS["water"],
+        phase: int = 0,
+    ) -> None:
+        """
+        Store the tiles of a layer.
+
+        :param tiles: (x, y, frames) tuples, the top left corner of the tiles in world pixels and their animation.
+        :param registry: The registry holding the timelines of the animations.
+        :param groups: Groups the layer belongs to.
+        :param z: The layer index for rendering.
+        :param phase: Offset of the tiles on their timeline, in frames.
+        """
+        super().__init__(*groups)
+
+        self.z = z
+        self.image = None  # drawn tile by tile, see `draw`
+        self.timelines: list[AnimationTimeline] = []
+
+        frame_sets: dict[tuple[Surface, ...], int] = {}
+        xs, ys, sets = [], [], []
+        for x, y, frames in tiles:
+            key = tuple(frames)
+            frame_set = frame_sets.get(key)
+            if frame_set is None:
+                frame_set = frame_sets[key] = len(self.timelines)
+                self.timelines.append(registry.timeline(frames))
+            xs.append(x)
+            ys.append(y)
+            sets.append(frame_set)
+
+        self.x = np.array(xs, dtype=np.int32)
+        self.y = np.array(ys, dtype=np.int32)
+        self.frame_set = np.array(sets, dtype=np.uint16)
+        self.phase = np.full(len(xs), phase, dtype=np.int32)
+
+        # Per set of frames: where its frames start in `frames`, how many there are, and the tile size
+        # (the size of the first frame, like the rect of a sprite)
+        self.frames = [frame for timeline in self.timelines for frame in timeline.frames]
+        counts = [len(timeline.frames) for timeline in self.timelines]
+        self.frame_count = np.array(counts, dtype=np.int32)
+        self.frame_start = np.cumsum([0, *counts[:-1]], dtype=np.int32)
+        self.set_size = np.array([timeline.frames[0].get_size() for timeline in self.timelines], dtype=np.int32)
+
+        # Size and center of each tile, for the culling and the placement of the scaled frames
+        self.width, self.height = self.set_size[self.frame_set].T if len(xs) else np.zeros((2, 0), dtype=np.int32)
+        self.center_x = self.x + self.width // 2
+        self.center_y = self.y + self.height // 2
+
+        if len(xs):
+            left, top = int(self.x.min()), int(self.y.min())
+            right, bottom = int((self.x + self.width).max()), int((self.y + self.height).max())
+            self.rect = pygame.FRect(left, top, right - left, bottom - top)
+        else:
+            self.rect = pygame.FRect(0, 0, 0, 0)
+
+        # Scaled frames, only valid for `_cached_scale`
+        self._scaled_frames: list[Surface] = []
+        self._cached_scale: float | None = None
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def get_scaled_frames(self, scale: float) -> list[Surface]:
+        """Return every frame scaled by `scale`, scaling them only once per zoom level."""
+        if self._cached_scale != scale:
+            sizes = np.repeat(self.set_size, self.frame_count, axis=0).tolist()
+            self._scaled_frames = [
+                pygame.transform.scale(frame, (int(width * scale), int(height * scale)))
+                for frame, (width, height) in zip(self.frames, sizes)
+            ]
+            self._cached_scale = scale
+        return self._scaled_frames
+
+    def draw(
+        self,
+        surface: Surface,
+        offset: pygame.math.Vector2,
+        scale: float,
+        view_rect: pygame.Rect | pygame.FRect,
+    ) -> None:
+        """
+        Blit the current frame of the tiles overlapping `view_rect` on `surface`.
+
+        The tiles are placed exactly like the camera places sprites: scaled around their center.
+
+        :param surface: The surface to draw on.
+        :param offset: The camera offset, in screen pixels.
+        :param scale: The camera scale.
+        :param view_rect: The visible area of the world, in world pixels.
+        """
+        visible = np.flatnonzero(
+            (self.x < view_rect.right)
+            & (self.x + self.width > view_rect.left)
+            & (self.y < view_rect.bottom)
+            & (self.y + self.height > view_rect.top)
+        )
+        if visible.size == 0:
+            return
+
+        frame_set = self.frame_set[visible]
+        steps = np.array([int(timeline.frame_index) for timeline in self.timelines], dtype=np.int64)
+        frame_count = self.frame_count[frame_set]
+        frame_index = self.frame_start[frame_set] + (steps[frame_set] + self.phase[visible]) % frame_count
+
+        scaled_width = (self.width[visible] * scale).astype(np.int64)
+        scaled_height = (self.height[visible] * scale).astype(np.int64)
+        screen_x = (self.center_x[visible] * scale).astype(np.int64) - scaled_width // 2 + int(offset.x)
+        screen_y = (self.center_y[visible] * scale).astype(np.int64) - scaled_height // 2 + int(offset.y)
+        positions = zip(screen_x.tolist(), screen_y.tolist())
+
+        frames = self.get_scaled_frames(scale)
+        surface.fblits([(frames[index], position) for index, position in zip(frame_index.tolist(), positions)])
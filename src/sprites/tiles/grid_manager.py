@@ -1,19 +1,47 @@
+from collections import OrderedDict
+
 import numpy as np
 import pygame  # type: ignore
 import pytmx
 from pygame import Surface  # type: ignore
 
 from src.settings import TILE_SIZE
-from src.sprites.tiles.pathfinding import PathFinder
+from src.sprites.tiles.pathfinding import FlowField, PathFinder
+from src.utils.profiler import profiler
 
 
 class GridManager:
+    # Value written into the grid matrix for every cell of these tile layers, applied in the map's layer order
+    LAYER_RULES: dict[str, int] = {"Sea": 0, "Islands": 1, "Shallow Sea": 1}
+    # Tiles with this boolean property in their tileset override the layer rules where they are placed:
+    # 1 (walkable) when true, 0 (obstacle) when false, the convention of the path finder
+    WALKABLE_PROPERTY = "walkable"
+    # Maximum number of coordinate labels kept rendered, a few screens worth of tiles
+    LABEL_CACHE_SIZE = 1024
+
     def __init__(
-            self, tmx_map: pytmx.TiledMap = None, tile_size: int = TILE_SIZE, grid_matrix: np.ndarray | None = None
+            self,
+            tmx_map: pytmx.TiledMap = None,
+            tile_size: int = TILE_SIZE,
+            grid_matrix: np.ndarray | None = None,
+            layer_rules: dict[str, int] | None = None,
+            walkable_property: str | None = WALKABLE_PROPERTY,
+            algorithm: str = "a_star",
     ):
+        """
+        :param tmx_map: The map to build the grid matrix from, unused if `grid_matrix` is given.
+        :param tile_size: The size of a tile in world pixels.
+        :param grid_matrix: A ready-made grid matrix, indexed [y, x].
+        :param layer_rules: Replaces `LAYER_RULES` when building the grid matrix from `tmx_map`.
+        :param walkable_property: The tile property overriding the layer rules, None to ignore tile properties.
+        :param algorithm: The search of the path finder, "a_star", "hpa" (hierarchical, for large maps)
+            or "jps" (jump point search, for uniform seas), see `PathFinder.ALGORITHMS`.
+        """
+        self.path_finder: PathFinder | None = None
+        self.layer_rules = self.LAYER_RULES if layer_rules is None else layer_rules
+        self.walkable_property = walkable_property
         if grid_matrix is not None:
             self.grid_matrix = grid_matrix
-            self.height, self.width = grid_matrix.shape
             self.tmx_map = None
         else:
             if tmx_map is None:
@@ -23,41 +51,135 @@ class GridManager:
             self.height = tmx_map.height  # Number of tiles high
             self.grid_matrix = self.create_grid_matrix()
         self.tile_size = tile_size
-        self.path_finder = PathFinder(self.grid_matrix)
+        self.path_finder = PathFinder(self.grid_matrix, algorithm=algorithm)
 
         self.display_surface: Surface | None = pygame.display.get_surface()
         self.font = pygame.font.SysFont(None, 12)
-        self.coordinate_surfaces = self._preload_coordinates_surfaces()
+        # Coordinate labels are rendered the first time their tile is drawn, least recently used ones are dropped
+        self.coordinate_surfaces: OrderedDict[tuple[int, int], Surface] = OrderedDict()
+        # Grid lines of the visible area, keyed by (camera scale, size in tiles)
+        self._grid_overlay: Surface | None = None
+        self._grid_overlay_key: tuple[float, int] | None = None
+
+    @property
+    def grid_matrix(self) -> np.ndarray:
+        """
+        The walkability matrix of the map, indexed [y, x].
+
+        Assigning a new matrix, or changing cells with `set_cell`, invalidates the cached paths.
+        Changes made in place on the array are not seen by the path finder.
+        """
+        return self._grid_matrix
+
+    @grid_matrix.setter
+    def grid_matrix(self, grid_matrix: np.ndarray) -> None:
+        self._grid_matrix = grid_matrix
+        self.height, self.width = grid_matrix.shape
+        if self.path_finder is not None:
+            self.path_finder.set_grid(grid_matrix)
+
+    def set_cell(self, x: int, y: int, value: int) -> None:
+        """Change a single cell of the grid matrix and invalidate the cached paths."""
+        self._grid_matrix[y, x] = value
+        if self.path_finder is not None:
+            self.path_finder.set_cell(x, y, value)
 
-    def _preload_coordinates_surfaces(self):
-        coordinate_surfaces = {}
-        for y in range(self.height):
-            for x in range(self.width):
-                text_surface = self.font.render(f"{x}, {y}", True, (255, 255, 255))
-                coordinate_surfaces[(x, y)] = text_surface.convert_alpha()
-        return coordinate_surfaces
+    def _get_coordinate_surface(self, x: int, y: int) -> Surface:
+        """Return the label of the tile (x, y), rendering it if it is not in the LRU cache."""
+        key = (x, y)
+        text_surface = self.coordinate_surfaces.get(key)
+        if text_surface is not None:
+            self.coordinate_surfaces.move_to_end(key)
+            return text_surface
+
+        text_surface = self.font.render(f"{x}, {y}", True, (255, 255, 255))
+        if pygame.display.get_surface() is not None:
+            text_surface = text_surface.convert_alpha()
+        self.coordinate_surfaces[key] = text_surface
+        if len(self.coordinate_surfaces) > self.LABEL_CACHE_SIZE:
+            self.coordinate_surfaces.popitem(last=False)
+        return text_surface
 
     def create_grid_matrix(self) -> np.ndarray:
         """
         Create a grid matrix from the Tiled map.
-        Each tile is represented as 0 (walkable) or 1 (non-walkable).
+
+        Each visible tile layer with an entry in `layer_rules` fills the matrix with its value.
+        Then, if `walkable_property` is set, every placed tile whose tileset gives it that property
+        overrides the cell with 1 (walkable) or 0 (obstacle). The gids of each layer are read as a
+        NumPy array and mapped through a lookup table, so no Python loop runs per tile.
         """
         if self.tmx_map is None:
             raise ValueError("TMX map must be None when creating grid matrix")
-        matrix = np.zeros((self.height, self.width), dtype=int)  # Initialize with zeros (walkable)
+        matrix = np.zeros((self.height, self.width), dtype=int)
+        property_lookup = self._walkable_property_lookup()
+
         for layer in self.tmx_map.visible_layers:
-            if isinstance(layer, pytmx.TiledTileLayer):
-                if layer.name == "Sea":
-                    for x, y, gid in layer:
-                        matrix[y, x] = 0  # Walkable
-                elif layer.name == "Islands" or layer.name == "Shallow Sea":
-                    for x, y, gid in layer:
-                        matrix[y, x] = 1  # Non-walkable
+            if not isinstance(layer, pytmx.TiledTileLayer):
+                continue
+            value = self.layer_rules.get(layer.name)
+            if value is not None:
+                matrix[: layer.height, : layer.width] = value
+
+            if property_lookup is not None:
+                gids = np.asarray(layer.data, dtype=np.intp)
+                if gids.size == 0:
+                    continue
+                overrides = property_lookup[gids]
+                placed = overrides >= 0
+                region = matrix[: gids.shape[0], : gids.shape[1]]
+                region[placed] = overrides[placed]
         return matrix
 
-    # Not the best way to do this, but it works for now
+    def _walkable_property_lookup(self) -> np.ndarray | None:
+        """
+        Return an array mapping each gid to its walkable value (1 or 0), or -1 if it has no such property.
+        None if no tile of the map has the property.
+        """
+        if self.tmx_map is None or self.walkable_property is None:
+            return None
+        values = {}
+        for gid, properties in self.tmx_map.tile_properties.items():
+            if properties and self.walkable_property in properties:
+                walkable = properties[self.walkable_property]
+                if isinstance(walkable, str):
+                    walkable = walkable.strip().lower() in ("1", "true", "yes")
+                values[gid] = 1 if walkable else 0
+        if not values:
+            return None
+        lookup = np.full(max(max(values), self.tmx_map.maxgid) + 1, -1, dtype=int)
+        lookup[list(values)] = list(values.values())
+        lookup[0] = -1  # gid 0 is an empty cell
+        return lookup
+
     def find_path(self, start: tuple[int, int], end: tuple[int, int]) -> list[list[int]]:
-        return self.path_finder.find_path(start, end)
+        """
+        Find a path between two tiles.
+
+        Paths are served from the LRU cache of the path finder when the same query was made on
+        the current grid, so repeated queries (e.g. hovering the same tile) cost a dictionary lookup.
+        """
+        if self.path_finder is None:
+            raise RuntimeError("The path finder is not initialized")
+        with profiler.section("pathfinding"):
+            return self.path_finder.find_path(start, end)
+
+    def flow_field(self, destination: tuple[int, int]) -> FlowField:
+        """
+        Return the flow field leading every tile to `destination`.
+
+        The field is computed once per destination and grid, then served from the cache of the path
+        finder, so any number of ships sailing to the same shop or island read their next tile with
+        `FlowField.next_step` (or `next_steps` for a whole fleet) instead of running their own search.
+        """
+        if self.path_finder is None:
+            raise RuntimeError("The path finder is not initialized")
+        with profiler.section("pathfinding"):
+            return self.path_finder.flow_field(destination)
+
+    def next_step(self, tile: tuple[int, int], destination: tuple[int, int]) -> tuple[int, int] | None:
+        """Return the tile to move to from `tile` towards `destination`, None if there is none."""
+        return self.flow_field(destination).next_step(tile)
 
     def get_tile_coordinates(
             self,
@@ -161,19 +283,58 @@ class GridManager:
             camera_offset: pygame.math.Vector2,
             camera_scale: float,
     ) -> None:
+        """
+        Draw the grid lines and the coordinate labels of the visible tiles.
+
+        The lines come from an overlay pre-rendered by `_get_grid_overlay`, blitted once for the
+        whole visible area, and the labels are blitted in a single `fblits` batch.
+        """
+        if self.display_surface is None:
+            raise RuntimeError("Display surface must be initialized")
+        columns = visible_end_x - visible_start_x
+        rows = visible_end_y - visible_start_y
+        if columns <= 0 or rows <= 0:
+            return
+
+        cell_size = self.tile_size * camera_scale
+        origin_x, origin_y = self._convert_to_screen_coordinates(
+            visible_start_x, visible_start_y, camera_offset, camera_scale
+        )
+
+        # The overlay covers the largest visible area, clamped areas at the map edges use its top left part
+        overlay = self._get_grid_overlay(camera_scale, max(columns, rows))
+        area = pygame.Rect(0, 0, int(columns * cell_size), int(rows * cell_size))
+        self.display_surface.blit(overlay, (int(origin_x), int(origin_y)), area)
+
+        half_cell = cell_size / 2
+        labels = []
         for y in range(visible_start_y, visible_end_y):
+            center_y = origin_y + (y - visible_start_y) * cell_size + half_cell
             for x in range(visible_start_x, visible_end_x):
-                if self.display_surface is None:
-                    raise RuntimeError("Display surface must be initialized")
-                screen_x, screen_y = self._convert_to_screen_coordinates(x, y, camera_offset, camera_scale)
-                rect = pygame.Rect(screen_x, screen_y, self.tile_size * camera_scale, self.tile_size * camera_scale)
-                pygame.draw.rect(self.display_surface, "dark grey", rect, 1)  # Draw grid lines
+                text_surface = self._get_coordinate_surface(x, y)
+                center_x = origin_x + (x - visible_start_x) * cell_size + half_cell
+                labels.append((text_surface, text_surface.get_rect(center=(center_x, center_y))))
+        self.display_surface.fblits(labels)
+
+    def _get_grid_overlay(self, camera_scale: float, size: int) -> Surface:
+        """
+        Return a transparent surface with the lines of a `size` x `size` block of tiles at `camera_scale`.
+
+        The overlay is rendered once and kept until the scale or the visible size changes.
+        """
+        key = (camera_scale, size)
+        if self._grid_overlay is not None and self._grid_overlay_key == key:
+            return self._grid_overlay
 
-                text_surface = self.coordinate_surfaces[(x, y)]
-                text_rect = text_surface.get_rect(
-                    center=(screen_x + self.tile_size * camera_scale / 2, screen_y + self.tile_size * camera_scale / 2)
-                )
-                self.display_surface.blit(text_surface, text_rect)
+        cell_size = self.tile_size * camera_scale
+        overlay = pygame.Surface((int(size * cell_size), int(size * cell_size)), pygame.SRCALPHA)
+        for row in range(size):
+            for column in range(size):
+                rect = pygame.Rect(int(column * cell_size), int(row * cell_size), cell_size, cell_size)
+                pygame.draw.rect(overlay, "dark grey", rect, 1)
+        self._grid_overlay = overlay
+        self._grid_overlay_key = key
+        return overlay
 
     def _convert_to_screen_coordinates(
             self, x: int, y: int, camera_offset: pygame.math.Vector2, camera_scale: float
@@ -197,7 +358,7 @@ class GridManager:
         end = (end_x, end_y)
 
         if 0 <= start[0] < self.width and 0 <= start[1] < self.height:
-            path = self.path_finder.find_path(start, end)
+            path = self.find_path(start, end)
             for x, y in path:
                 if self.display_surface is None:
                     raise RuntimeError("Display surface must be initialized")
@@ -0,0 +1,306 @@
+"""
+Compiled binary cache of Tiled maps.
+
+Parsing a TMX file with `pytmx` reads and decodes the whole XML document, then slices every tileset.
+`load_map` does that once, and stores the result next to the game data:
+
+- one NumPy gid array per tile layer (`<layer index>.npy`),
+- the walkability matrix of the `GridManager` (`walkable.npy`),
+- the objects of the object groups, in `manifest.json`,
+- an atlas with one cell per tile image (`atlas.png`).
+
+The manifest also records the modification time and the SHA-1 of the TMX file and of its tilesets,
+and a SHA-1 of the `GridManager` walkability rules the matrix was built with.
+On the next launches the arrays are memory mapped with `numpy.load(mmap_mode="r")` and the atlas is sliced
+into subsurfaces, so no XML is parsed unless one of the source files changed.
+"""
+
+import hashlib
+import json
+import math
+import os
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+import pygame  # type: ignore
+import pytmx
+from pygame import Surface  # type: ignore
+from pytmx.util_pygame import load_pygame  # type: ignore
+
+from src.sprites.tiles.grid_manager import GridManager
+
+CACHE_DIR = os.path.join(".", "data", "cache")
+# Bump when the layout of the cache changes, older caches are then recompiled
+CACHE_VERSION = 1
+ATLAS_COLUMNS = 16
+
+
+class CompiledObject:
+    """An object of an object group, with the attributes of `pytmx.TiledObject` used by the game."""
+
+    def __init__(
+        self,
+        name: str | None,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        properties: dict[str, Any],
+        object_type: str | None = None,
+    ) -> None:
+        self.name = name
+        self.type = object_type
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.properties = properties
+
+
+class CompiledTileLayer:
+    """A tile layer of a compiled map, the gids are indices into the tile images of the map."""
+
+    def __init__(self, name: str, data: np.ndarray, images: list[Surface | None], visible: bool = True) -> None:
+        self.name = name
+        self.data = data
+        self.images = images
+        self.visible = visible
+        self.height, self.width = data.shape
+
+    def tiles(self) -> Iterator[tuple[int, int, Surface]]:
+        """Yield (x, y, surface) for every placed tile, row by row like `pytmx.TiledTileLayer.tiles`."""
+        ys, xs = np.nonzero(self.data)
+        for x, y, gid in zip(xs.tolist(), ys.tolist(), self.data[ys, xs].tolist()):
+            image = self.images[gid]
+            if image is not None:
+                yield x, y, image
+
+
+class CompiledObjectGroup(list):
+    """An object group of a compiled map, a list of `CompiledObject`."""
+
+    def __init__(self, name: str, objects: list[CompiledObject], visible: bool = True) -> None:
+        super().__init__(objects)
+        self.name = name
+        self.visible = visible
+
+
+class CompiledMap:
+    """
+    A map loaded from the cache, exposing the part of the `pytmx.TiledMap` API used by the game.
+
+    Attributes:
+        width (int): Number of tiles wide.
+        height (int): Number of tiles high.
+        tilewidth (int): Width of a tile in pixels.
+        tileheight (int): Height of a tile in pixels.
+        walkable (np.ndarray): The grid matrix built by `GridManager` when the map was compiled (read-only).
+        images (list[Surface | None]): The tile images, indexed by gid.
+        layers (list[CompiledTileLayer | CompiledObjectGroup]): The layers in the map order.
+    """
+
+    def __init__(self, manifest: dict[str, Any], directory: str) -> None:
+        self.filename = manifest["source"]
+        self.width = manifest["width"]
+        self.height = manifest["height"]
+        self.tilewidth = manifest["tilewidth"]
+        self.tileheight = manifest["tileheight"]
+        self.walkable = np.load(os.path.join(directory, "walkable.npy"), mmap_mode="r")
+        self.images = self._load_images(manifest, directory)
+
+        self.layers: list[CompiledTileLayer | CompiledObjectGroup] = []
+        for layer in manifest["layers"]:
+            if layer["kind"] == "tiles":
+                data = np.load(os.path.join(directory, layer["file"]), mmap_mode="r")
+                self.layers.append(CompiledTileLayer(layer["name"], data, self.images, layer["visible"]))
+            else:
+                objects = [CompiledObject(**obj) for obj in layer["objects"]]
+                self.layers.append(CompiledObjectGroup(layer["name"], objects, layer["visible"]))
+        self._layers_by_name = {layer.name: layer for layer in self.layers}
+
+    @staticmethod
+    def _load_images(manifest: dict[str, Any], directory: str) -> list[Surface | None]:
+        atlas = pygame.image.load(os.path.join(directory, "atlas.png"))
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        cell_width, cell_height = manifest["atlas_cell"]
+        images: list[Surface | None] = []
+        for slot, size in enumerate(manifest["image_sizes"]):
+            if size is None:
+                images.append(None)
+                continue
+            column, row = slot % ATLAS_COLUMNS, slot // ATLAS_COLUMNS
+            images.append(atlas.subsurface((column * cell_width, row * cell_height, *size)))
+        return images
+
+    @property
+    def visible_layers(self) -> Iterator[CompiledTileLayer | CompiledObjectGroup]:
+        return (layer for layer in self.layers if layer.visible)
+
+    def get_layer_by_name(self, name: str) -> Any:
+        """Return the layer called `name`, raises ValueError if there is none."""
+        try:
+            return self._layers_by_name[name]
+        except KeyError:
+            raise ValueError(f"Layer '{name}' not found.") from None
+
+
+def cache_directory(tmx_path: str, cache_dir: str = CACHE_DIR) -> str:
+    """Return the directory holding the compiled cache of `tmx_path`."""
+    return os.path.join(cache_dir, os.path.splitext(os.path.basename(tmx_path))[0])
+
+
+def _file_digest(path: str) -> str:
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 16), b""):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+
+def _rules_digest() -> str:
+    """The SHA-1 of the rules `GridManager` builds the walkability matrix with, which invalidate the cache too."""
+    rules = {"layer_rules": GridManager.LAYER_RULES, "walkable_property": GridManager.WALKABLE_PROPERTY}
+    return hashlib.sha1(json.dumps(rules, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _source_files(tmx_path: str) -> list[str]:
+    """The TMX file and the files of its external tilesets, whose changes invalidate the cache."""
+    files = [tmx_path]
+    directory = os.path.dirname(tmx_path)
+    for tileset in ET.parse(tmx_path).getroot().iter("tileset"):
+        source = tileset.get("source")
+        if source is None:
+            continue
+        tsx_path = os.path.normpath(os.path.join(directory, source))
+        if not os.path.exists(tsx_path):
+            continue
+        files.append(tsx_path)
+        image = ET.parse(tsx_path).getroot().find("image")
+        if image is not None and image.get("source"):
+            files.append(os.path.normpath(os.path.join(os.path.dirname(tsx_path), image.get("source", ""))))
+    return [path for path in files if os.path.exists(path)]
+
+
+def _is_up_to_date(manifest: dict[str, Any], directory: str) -> bool:
+    """
+    Check the sources recorded in the manifest: files with an unchanged mtime are trusted,
+    the others are hashed and accepted if their content did not change.
+    The manifest is rewritten with the new mtimes so the next check is cheap again.
+    """
+    if manifest.get("version") != CACHE_VERSION or manifest.get("walkable_rules") != _rules_digest():
+        return False
+    touched = False
+    for source in manifest["sources"]:
+        try:
+            mtime = os.path.getmtime(source["path"])
+        except OSError:
+            return False
+        if mtime == source["mtime"]:
+            continue
+        if _file_digest(source["path"]) != source["sha1"]:
+            return False
+        source["mtime"] = mtime
+        touched = True
+    if touched:
+        _write_manifest(manifest, directory)
+    return True
+
+
+def _write_manifest(manifest: dict[str, Any], directory: str) -> None:
+    # Written last and atomically, a cache without a manifest is simply recompiled
+    temporary_path = os.path.join(directory, "manifest.json.tmp")
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=1)
+    os.replace(temporary_path, os.path.join(directory, "manifest.json"))
+
+
+def compile_map(tmx_path: str, cache_dir: str = CACHE_DIR) -> str:
+    """
+    Parse `tmx_path` with pytmx and write its compiled cache.
+
+    A display surface must exist, like for `pytmx.util_pygame.load_pygame`.
+
+    :return: The directory of the cache.
+    """
+    directory = cache_directory(tmx_path, cache_dir)
+    os.makedirs(directory, exist_ok=True)
+    sources = [
+        {"path": path, "mtime": os.path.getmtime(path), "sha1": _file_digest(path)} for path in _source_files(tmx_path)
+    ]
+    tmx_map = load_pygame(tmx_path)
+
+    layers: list[dict[str, Any]] = []
+    for index, layer in enumerate(tmx_map.layers):
+        if isinstance(layer, pytmx.TiledTileLayer):
+            file_name = f"{index}.npy"
+            np.save(os.path.join(directory, file_name), np.asarray(layer.data, dtype=np.uint16))
+            layers.append({"kind": "tiles", "name": layer.name, "visible": bool(layer.visible), "file": file_name})
+        elif isinstance(layer, pytmx.TiledObjectGroup):
+            objects = [
+                {
+                    "name": obj.name,
+                    "object_type": obj.type,
+                    "x": obj.x,
+                    "y": obj.y,
+                    "width": obj.width,
+                    "height": obj.height,
+                    "properties": dict(obj.properties),
+                }
+                for obj in layer
+            ]
+            layers.append({"kind": "objects", "name": layer.name, "visible": bool(layer.visible), "objects": objects})
+
+    walkable = GridManager(tmx_map, tile_size=tmx_map.tilewidth).grid_matrix
+    np.save(os.path.join(directory, "walkable.npy"), walkable)
+
+    image_sizes = [None if image is None else list(image.get_size()) for image in tmx_map.images]
+    cell_width = max([size[0] for size in image_sizes if size] or [tmx_map.tilewidth])
+    cell_height = max([size[1] for size in image_sizes if size] or [tmx_map.tileheight])
+    rows = math.ceil(len(image_sizes) / ATLAS_COLUMNS)
+    atlas = pygame.Surface((ATLAS_COLUMNS * cell_width, rows * cell_height), pygame.SRCALPHA)
+    for slot, image in enumerate(tmx_map.images):
+        if image is not None:
+            atlas.blit(image, ((slot % ATLAS_COLUMNS) * cell_width, (slot // ATLAS_COLUMNS) * cell_height))
+    pygame.image.save(atlas, os.path.join(directory, "atlas.png"))
+
+    manifest = {
+        "version": CACHE_VERSION,
+        "source": os.path.normpath(tmx_path),
+        "sources": sources,
+        "walkable_rules": _rules_digest(),
+        "width": tmx_map.width,
+        "height": tmx_map.height,
+        "tilewidth": tmx_map.tilewidth,
+        "tileheight": tmx_map.tileheight,
+        "atlas_cell": [cell_width, cell_height],
+        "image_sizes": image_sizes,
+        "layers": layers,
+    }
+    _write_manifest(manifest, directory)
+    return directory
+
+
+def load_map(tmx_path: str, cache_dir: str = CACHE_DIR) -> CompiledMap:
+    """
+    Load `tmx_path` from its compiled cache, compiling it first if the cache is missing or outdated.
+    """
+    directory = cache_directory(tmx_path, cache_dir)
+    manifest_path = os.path.join(directory, "manifest.json")
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = None
+
+    if (
+        manifest is None
+        or manifest.get("source") != os.path.normpath(tmx_path)
+        or not _is_up_to_date(manifest, directory)
+    ):
+        compile_map(tmx_path, cache_dir)
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    return CompiledMap(manifest, directory)
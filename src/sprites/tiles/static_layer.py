@@ -0,0 +1,112 @@
+from collections.abc import Iterable
+
+import pygame  # type: ignore
+from pygame import Surface  # type: ignore
+from pygame.sprite import Group, Sprite  # type: ignore
+
+from src.settings import TILE_SIZE, WORLD_LAYERS
+
+
+class StaticTileLayer(Sprite):
+    """
+    A tile layer that never changes, pre-rendered into a few large chunk surfaces.
+
+    Instead of one sprite per tile, the tiles are composited at load time into chunks of
+    `chunk_size` x `chunk_size` tiles. The camera draws the layer with one blit per visible chunk,
+    and each chunk is scaled once per zoom level, the first time it becomes visible.
+
+    Attributes:
+        rect (FRect): The area covered by the layer in world pixels.
+        z (int): The layer index for rendering.
+        chunks (dict[tuple[int, int], Surface]): The unscaled chunk surfaces, keyed by chunk column and row.
+    """
+
+    def __init__(
+        self,
+        tiles: Iterable[tuple[int, int, Surface]],
+        map_size: tuple[int, int],
+        groups: tuple[Group, ...] = (),
+        z: int = WORLD_LAYERS["bg"],
+        tile_size: int = TILE_SIZE,
+        chunk_size: int = 32,
+    ) -> None:
+        """
+        Build the chunks of a tile layer.
+
+        :param tiles: (x, y, surface) tuples in tile coordinates, e.g. from `pytmx.TiledTileLayer.tiles()`.
+        :param map_size: The (width, height) of the map in tiles.
+        :param groups: Groups the layer belongs to.
+        :param z: The layer index for rendering.
+        :param tile_size: The size of a tile in world pixels.
+        :param chunk_size: The width and height of a chunk in tiles.
+        """
+        super().__init__(*groups)
+
+        self.z = z
+        self.tile_size = tile_size
+        self.chunk_pixels = chunk_size * tile_size
+        self.rect = pygame.FRect(0, 0, map_size[0] * tile_size, map_size[1] * tile_size)
+        self.image = None  # drawn chunk by chunk, see `draw`
+
+        self.chunks: dict[tuple[int, int], Surface] = {}
+        for x, y, surface in tiles:
+            key = (x // chunk_size, y // chunk_size)
+            chunk = self.chunks.get(key)
+            if chunk is None:
+                chunk = Surface((self.chunk_pixels, self.chunk_pixels), pygame.SRCALPHA)
+                self.chunks[key] = chunk
+            chunk.blit(surface, ((x % chunk_size) * tile_size, (y % chunk_size) * tile_size))
+
+        # Convert to the display format once the chunks are complete, for fast blitting
+        if pygame.display.get_surface() is not None:
+            self.chunks = {key: chunk.convert_alpha() for key, chunk in self.chunks.items()}
+
+        # Scaled chunks, only valid for `_cached_scale`
+        self._scaled_chunks: dict[tuple[int, int], Surface] = {}
+        self._cached_scale: float | None = None
+
+    def get_scaled_chunk(self, key: tuple[int, int], scale: float) -> Surface:
+        """Return the chunk `key` scaled by `scale`, scaling it only the first time at a given zoom level."""
+        if self._cached_scale != scale:
+            self._scaled_chunks.clear()
+            self._cached_scale = scale
+
+        scaled_chunk = self._scaled_chunks.get(key)
+        if scaled_chunk is None:
+            chunk = self.chunks[key]
+            if scale == 1:
+                scaled_chunk = chunk
+            else:
+                size = int(self.chunk_pixels * scale)
+                scaled_chunk = pygame.transform.scale(chunk, (size, size))
+            self._scaled_chunks[key] = scaled_chunk
+        return scaled_chunk
+
+    def draw(
+        self,
+        surface: Surface,
+        offset: pygame.math.Vector2,
+        scale: float,
+        view_rect: pygame.Rect | pygame.FRect,
+    ) -> None:
+        """
+        Blit the chunks overlapping `view_rect` on `surface`.
+
+        :param surface: The surface to draw on.
+        :param offset: The camera offset, in screen pixels.
+        :param scale: The camera scale.
+        :param view_rect: The visible area of the world, in world pixels.
+        """
+        start_x = max(0, int(view_rect.left // self.chunk_pixels))
+        start_y = max(0, int(view_rect.top // self.chunk_pixels))
+        end_x = int(view_rect.right // self.chunk_pixels)
+        end_y = int(view_rect.bottom // self.chunk_pixels)
+
+        for chunk_y in range(start_y, end_y + 1):
+            for chunk_x in range(start_x, end_x + 1):
+                key = (chunk_x, chunk_y)
+                if key not in self.chunks:
+                    continue
+                screen_x = int(chunk_x * self.chunk_pixels * scale) + int(offset.x)
+                screen_y = int(chunk_y * self.chunk_pixels * scale) + int(offset.y)
+                surface.blit(self.get_scaled_chunk(key, scale), (screen_x, screen_y))
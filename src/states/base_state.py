@@ -29,6 +29,13 @@ class BaseState(ABC):
         and return current state or another one
         """
 
+    def fixed_update(self, dt: float) -> None:
+        """
+        advance the simulation by one fixed step of `dt` seconds
+        called zero or more times per frame by the game loop, after `update`
+        states without a simulation keep this default, which does nothing
+        """
+
     @abstractmethod
     def render(self, screen: pygame.Surface) -> None:
         """
@@ -5,20 +5,25 @@ Represents the GameRunning state, where the player controls a ship and interacts
 import json
 import os
 
+import numpy as np
 import pygame  # type: ignore
-from pytmx.util_pygame import load_pygame  # type: ignore
 
 from src.inventory import Inventory
 from src.settings import TILE_SIZE, WORLD_LAYERS
-from src.sprites.animations import AnimatedSprites
-from src.sprites.base import BaseSprite
+from src.sprites.animations import AnimationRegistry
 from src.sprites.camera.player_camera import PlayerCamera
 from src.sprites.entities.player import Player
+from src.sprites.entities.ship_movement import ShipMovement
+from src.sprites.tiles.animated_layer import AnimatedTileLayer
 from src.sprites.tiles.grid_manager import GridManager
+from src.sprites.tiles.map_cache import load_map
+from src.sprites.tiles.static_layer import StaticTileLayer
 from src.states.base_state import BaseState
 from src.states.paused import Paused
 from src.states.shop_state import ShowShop, WindowShop
-from src.support import all_character_import, coast_importer, import_folder
+from src.support import all_character_import, character_paths, coast_importer, folder_paths, import_folder
+from src.utils.profiler import profiler
+from src.utils.save_game import GameSnapshot, SaveError, SaveManager
 
 
 class GameRunning(BaseState):
@@ -36,27 +41,41 @@ class GameRunning(BaseState):
         super().__init__(game_state_manager)
 
         # Initialize player inventory
-        self.clock = pygame.Clock()
         self.player_inventory = Inventory()
         self.load_inventory_from_json("data/inventory.json")
 
+        # Quick-save (F5) and quick-load (F9), written by a background thread
+        self.save_manager = SaveManager()
+
         # Render the grid
         self.grid_manager: GridManager | None = None  # Initialize grid_manager as None
         self.show_grid: bool = True
 
+        # Moves the ships along their paths, all of them in one pass per simulation step
+        self.ships = ShipMovement(tile_size=TILE_SIZE)
+
         sprite_group: pygame.sprite.Group = pygame.sprite.Group()  # Initialize sprite group
         self.all_sprites: PlayerCamera  # Initialize all_sprites as PlayerCamera
 
         # The start positions will be one of the 4 islands in the corners of the board
         self.setup(player_start_pos="top_left_island", sprite_group=sprite_group)
+        # Position of the player before the last simulation step, rendering interpolates from it
+        self.player_previous_pos = self.player.rect.topleft
 
         # Create the player camera and add all sprites to it
         sprites = list(sprite_group)
-        self.all_sprites = PlayerCamera(self.tmx_map["map"], self.player.rect.topleft)
+        self.all_sprites = PlayerCamera(self.tmx_map["map"], self.player.rect.topleft, grid=self.grid_manager)
         for sprite in sprites:
             self.all_sprites.add(sprite)
 
-        self.font = pygame.font.Font(None, 36)
+        # Everything loaded by setup stays in place except the player, index it for viewport culling.
+        # Tile layers cull their own chunks and tiles, and are drawn every frame.
+        self.all_sprites.build_spatial_index(
+            sprite
+            for sprite in sprites
+            if sprite is not self.player and not isinstance(sprite, (StaticTileLayer, AnimatedTileLayer))
+        )
+
         self.shop_window = pygame.Surface((800, 600))
         self.in_shop = False
 
@@ -64,13 +83,16 @@ class GameRunning(BaseState):
         if sprite_group is None:
             sprite_group = pygame.sprite.Group()
 
-        # Load the TMX map and make it an attribute of the class
-        self.tmx_map = {"map": load_pygame(os.path.join(".", "data", "new_maps", "100x100_map.tmx"))}
+        # Load the TMX map from its compiled cache, built on the first launch, and make it an attribute of the class
+        self.tmx_map = {"map": load_map(os.path.join(".", "data", "new_maps", "100x100_map.tmx"))}
         if not self.tmx_map:
             raise ValueError("Failed to load the TMX map")
 
-        # Initialize the grid manager
-        self.grid_manager = GridManager(self.tmx_map["map"], TILE_SIZE)
+        # Initialize the grid manager with the walkability matrix compiled with the map (copied, it is read-only)
+        self.grid_manager = GridManager(grid_matrix=np.array(self.tmx_map["map"].walkable), tile_size=TILE_SIZE)
+
+        # Shared clocks for the animated tiles, advanced once per frame in update
+        self.animations = AnimationRegistry()
 
         self.world_frames = {
             "water": import_folder(".", "images", "tilesets", "temporary_water"),
@@ -78,29 +100,36 @@ class GameRunning(BaseState):
             "ships": all_character_import(".", "images", "tilesets", "ships"),
         }
 
+        map_size = (self.tmx_map["map"].width, self.tmx_map["map"].height)
+
         # Sea
-        for x, y, surface in self.tmx_map["map"].get_layer_by_name("Sea").tiles():
-            BaseSprite(
-                pos=(x * TILE_SIZE, y * TILE_SIZE),
-                surf=surface,
-                groups=(sprite_group,),
-                z=WORLD_LAYERS["bg"],
-            )
+        StaticTileLayer(
+            tiles=self.tmx_map["map"].get_layer_by_name("Sea").tiles(),
+            map_size=map_size,
+            groups=(sprite_group,),
+            z=WORLD_LAYERS["bg"],
+        )
 
         # Water animated
-        for obj in self.tmx_map["map"].get_layer_by_name("Water"):
-            for x in range(int(obj.x), int(obj.x + obj.width), TILE_SIZE):
-                for y in range(int(obj.y), int(obj.y + obj.height), TILE_SIZE):
-                    AnimatedSprites(
-                        pos=(x, y),
-                        frames=self.world_frames["water"],
-                        groups=(sprite_group,),
-                        z=WORLD_LAYERS["water"],
-                    )
+        AnimatedTileLayer(
+            tiles=(
+                (x, y, self.world_frames["water"])
+                for obj in self.tmx_map["map"].get_layer_by_name("Water")
+                for x in range(int(obj.x), int(obj.x + obj.width), TILE_SIZE)
+                for y in range(int(obj.y), int(obj.y + obj.height), TILE_SIZE)
+            ),
+            registry=self.animations,
+            groups=(sprite_group,),
+            z=WORLD_LAYERS["water"],
+        )
 
         # Shallow water
-        for x, y, surface in self.tmx_map["map"].get_layer_by_name("Shallow Sea").tiles():
-            BaseSprite(pos=(x * TILE_SIZE, y * TILE_SIZE), surf=surface, groups=(sprite_group,), z=WORLD_LAYERS["bg"])
+        StaticTileLayer(
+            tiles=self.tmx_map["map"].get_layer_by_name("Shallow Sea").tiles(),
+            map_size=map_size,
+            groups=(sprite_group,),
+            z=WORLD_LAYERS["bg"],
+        )
 
         # Buildings
         for x, y, surface in self.tmx_map["map"].get_layer_by_name("Shop").tiles():
@@ -109,14 +138,12 @@ class GameRunning(BaseState):
             )
 
         # Islands
-        islands = self.tmx_map["map"].get_layer_by_name("Islands")
-        for x, y, surface in islands.tiles():
-            BaseSprite(
-                pos=(x * TILE_SIZE, y * TILE_SIZE),
-                surf=surface,
-                groups=(sprite_group,),
-                z=WORLD_LAYERS["bg"],
-            )
+        StaticTileLayer(
+            tiles=self.tmx_map["map"].get_layer_by_name("Islands").tiles(),
+            map_size=map_size,
+            groups=(sprite_group,),
+            z=WORLD_LAYERS["bg"],
+        )
 
         # Entities
         for obj in self.tmx_map["map"].get_layer_by_name("Ships"):
@@ -129,43 +156,72 @@ class GameRunning(BaseState):
                     pos=(grid_x, grid_y),
                     frames=self.world_frames["ships"]["player_test_ship"],
                     groups=(sprite_group,),
+                    movement=self.ships,
                 )
 
         # Coast
-        for obj in self.tmx_map["map"].get_layer_by_name("Coast"):
-            terrain = obj.properties["terrain"]
-            side = obj.properties["side"]
-            AnimatedSprites(
-                pos=(obj.x, obj.y),
-                frames=self.world_frames["coast"][terrain][side],
-                groups=(sprite_group,),
-                z=WORLD_LAYERS["bg"],
-            )
+        AnimatedTileLayer(
+            tiles=(
+                (int(obj.x), int(obj.y), self.world_frames["coast"][obj.properties["terrain"]][obj.properties["side"]])
+                for obj in self.tmx_map["map"].get_layer_by_name("Coast")
+            ),
+            registry=self.animations,
+            groups=(sprite_group,),
+            z=WORLD_LAYERS["bg"],
+        )
+
+    @staticmethod
+    def image_paths() -> list[str]:
+        """
+        the images decoded by setup, for the loading screen to decode them in the background beforehand
+        """
+        return [
+            *folder_paths(".", "images", "tilesets", "temporary_water"),
+            os.path.join(".", "images", "tilesets", "coast.png"),
+            *character_paths(".", "images", "tilesets", "ships").values(),
+        ]
 
     def load_inventory_from_json(self, file_path: str):
-        """Load initial inventory items from JSON file."""
+        """
+        Load initial inventory items from JSON file.
+
+        The items are added in one all-or-nothing batch: if an entry has a negative or non-integer
+        quantity, no item is loaded and the error names it. Entries with a quantity of 0 are skipped.
+        """
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 items = json.load(f)
-                for item_name, properties in items.items():
-                    quantity = properties.get("quantity", 1)  # Default to 1 if missing
-                    self.player_inventory.add_item(item_name, quantity)
+                # Default to 1 if missing
+                result = self.player_inventory.apply_changes(
+                    (item_name, properties.get("quantity", 1)) for item_name, properties in items.items()
+                )
+                if not result.success:
+                    print(f"Error: Could not load the inventory from {file_path}: {result}")
         except (FileNotFoundError, json.JSONDecodeError):
             print(f"Error: The file at {file_path} does not exist.")
 
-    def update(self, events) -> None:
+    def quick_save(self) -> None:
+        """Snapshot the session and write it in the background."""
+        snapshot = GameSnapshot.capture(self.player, self.player_inventory, self.grid_manager, self.show_grid)
+        self.save_manager.save(snapshot)
+
+    def quick_load(self) -> None:
+        """Restore the session from the last quick-save, if there is one."""
+        try:
+            snapshot = self.save_manager.load()
+        except (FileNotFoundError, SaveError) as error:
+            print(f"Error: Could not load the quick-save: {error}")
+            return
+        snapshot.restore(self.player, self.player_inventory, self.grid_manager)
+        self.player_previous_pos = self.player.rect.topleft
+        self.show_grid = snapshot.show_grid
+
+    def fixed_update(self, dt: float) -> None:
         """
-        update each sprites and handle events
+        update each sprites by one simulation step
         """
-
-        collide: bool = (
-                self.player is not None
-                and self.shop is not None
-                and isinstance(self.player.rect, (pygame.Rect, pygame.FRect))
-                and isinstance(self.shop.rect, (pygame.Rect, pygame.FRect))
-                and self.player.rect.colliderect(self.shop.rect)
-        )
-        dt = self.clock.tick() / 1000
+        self.player_previous_pos = self.player.rect.topleft
+        self.animations.update(dt)
         self.all_sprites.update(dt)
 
         # Handle player movement and grid snapping
@@ -176,7 +232,20 @@ class GameRunning(BaseState):
             camera_offset = pygame.math.Vector2()
             scale = 1.0
         self.player.update(dt, grid=self.grid_manager, camera_offset=camera_offset, camera_scale=scale)
+        self.ships.update(dt)
 
+    def update(self, events) -> None:
+        """
+        handle events
+        """
+
+        collide: bool = (
+                self.player is not None
+                and self.shop is not None
+                and isinstance(self.player.rect, (pygame.Rect, pygame.FRect))
+                and isinstance(self.shop.rect, (pygame.Rect, pygame.FRect))
+                and self.player.rect.colliderect(self.shop.rect)
+        )
         # get events like keypress or mouse clicks
         for event in events:
             if event.type == pygame.KEYDOWN:
@@ -184,28 +253,44 @@ class GameRunning(BaseState):
                     self.game_state_manager.enter_state(Paused(self.game_state_manager, self.player_inventory))
                 elif event.key == pygame.K_g:  # Toggle grid with "G" key
                     self.show_grid = not self.show_grid
+                elif event.key == pygame.K_F5:
+                    self.quick_save()
+                elif event.key == pygame.K_F9:
+                    self.quick_load()
                 elif collide and event.key == pygame.K_e:
                     self.game_state_manager.enter_state(
                         WindowShop(self.game_state_manager, self.player, self.shop, self.player_inventory)
                     )
 
+    def _interpolated_player_pos(self) -> tuple[float, float]:
+        """The player position between the last two simulation steps, as far as the game loop is into the next."""
+        alpha = getattr(self.game_state_manager, "interpolation", 1.0)
+        (previous_x, previous_y), (x, y) = self.player_previous_pos, self.player.rect.topleft
+        return previous_x + (x - previous_x) * alpha, previous_y + (y - previous_y) * alpha
+
     def render(self, screen) -> None:
         """Draw sprites to the canvas."""
         screen.fill("#000000")
         if isinstance(self.all_sprites, PlayerCamera):
-            self.all_sprites.draw(self.player.rect.center, show_grid=self.show_grid)
+            # The player and the camera are drawn at the interpolated position, the simulation keeps the real one
+            position = self.player.rect.topleft
+            self.player.rect.topleft = self._interpolated_player_pos()
+            with profiler.section("camera_draw"):
+                self.all_sprites.draw(self.player.rect.center, show_grid=self.show_grid)
+            self.player.rect.topleft = position
 
         # Pass the player's position to the draw method
         if self.player and self.grid_manager is not None:
             mouse_pos = pygame.mouse.get_pos()
             if self.show_grid:
-                self.grid_manager.draw(
-                    player_pos=(int(self.player.rect.topleft[0]), int(self.player.rect.topleft[1])),
-                    mouse_pos=mouse_pos,
-                    camera_offset=self.all_sprites.offset,
-                    camera_scale=self.all_sprites.scale,
-                    visible_radius=5,
-                )
+                with profiler.section("grid_draw"):  # includes the pathfinding of the hovered tile
+                    self.grid_manager.draw(
+                        player_pos=(int(self.player.rect.topleft[0]), int(self.player.rect.topleft[1])),
+                        mouse_pos=mouse_pos,
+                        camera_offset=self.all_sprites.offset,
+                        camera_scale=self.all_sprites.scale,
+                        visible_radius=5,
+                    )
 
             # Get tile coordinates with camera offset and scale
             tile_x, tile_y = self.grid_manager.get_tile_coordinates(
@@ -0,0 +1,188 @@
+"""
+base of the overlay states listing the inventory
+(Paused and WindowShop)
+"""
+
+from abc import abstractmethod
+
+import pygame  # type: ignore
+
+from src.inventory import Inventory
+from src.states.base_state import BaseState
+from src.utils.profiler import profiler
+from src.utils.text_cache import text_cache
+
+
+class ItemListState(BaseState):
+    """
+    A scrolling list of the inventory items, with an icon, the quantity, the name and two buttons per item,
+    a hint line and a temporary action message.
+
+    The list is drawn on an offscreen surface that is only redrawn when something visible changed
+    (a scroll, a click changing the inventory, a message appearing or timing out).
+    Only the changed areas are then copied to the display and passed to `pygame.display.update`,
+    so an open menu costs almost nothing while the player reads it.
+    """
+
+    ITEM_HEIGHT = 60
+    LIST_TOP = 50  # Start below the title
+    LIST_LEFT = 50
+    BUTTONS_LEFT = 400
+
+    def __init__(
+        self,
+        game_state_manager,
+        inventory: Inventory,
+        size: tuple[int, int],
+        button_labels: tuple[str, str],
+        hint: str,
+        max_visible_items: int,
+    ) -> None:
+        super().__init__(game_state_manager)
+
+        self.inventory = inventory
+        # self.screen is a temp surface, blitted to the display after the rendering
+        self.screen = pygame.Surface(size)
+
+        # Scrolling inventory
+        self.scroll_offset = 0
+        self.max_visible_items = max_visible_items
+        self.icons: dict[str, pygame.Surface] = {}
+
+        # Button dimensions and labels
+        self.button_width = 100
+        self.button_height = 50
+        self.button_labels = button_labels
+        self.hint = hint
+
+        # Initialize button actions
+        self.button_actions: dict[str, tuple[pygame.Rect, pygame.Rect]] = {}
+
+        # Action messages
+        self.message = ""
+        self.message_end_time = 0  # Time to display the message
+
+        # What the offscreen surface currently shows, to find out what changed
+        self._drawn_items: tuple | None = None
+        self._drawn_message: str | None = None
+        self._message_rect: pygame.Rect | None = None
+        self._presented = False  # whether the whole surface was copied to the display once
+        self.dirty_rects: list[pygame.Rect] = []
+
+    @abstractmethod
+    def first_action(self, item: str) -> str:
+        """Action of the first button of an item, return the message to show."""
+
+    @abstractmethod
+    def second_action(self, item: str) -> str:
+        """Action of the second button of an item, return the message to show."""
+
+    def handle_mouse_click(self, mouse_pos) -> None:
+        """Handle mouse clicks on buttons."""
+        for item, (first_button, second_button) in self.button_actions.items():
+            if first_button.collidepoint(mouse_pos):
+                self.message = self.first_action(item)  # `self.message` stores strings
+                self.message_end_time = pygame.time.get_ticks() + 3000  # 3 seconds
+            elif second_button.collidepoint(mouse_pos):
+                self.message = self.second_action(item)
+                self.message_end_time = pygame.time.get_ticks() + 4000  # 4 seconds
+
+    def scroll(self, amount: int) -> None:
+        """Scroll the list by `amount` items, up for positive values."""
+        self.scroll_offset = max(0, self.scroll_offset - amount)
+        max_offset = max(0, len(self.inventory.items) - self.max_visible_items)
+        self.scroll_offset = min(self.scroll_offset, max_offset)
+
+    def draw_buttons(self, x: int, y: int, item: str) -> tuple[pygame.Rect, pygame.Rect]:
+        """Draw the two buttons of a specific item."""
+        first_button = pygame.Rect(x, y, self.button_width, self.button_height)
+        second_button = pygame.Rect(x + self.button_width + 10, y, self.button_width, self.button_height)
+
+        pygame.draw.rect(self.screen, (0, 255, 0), first_button)  # Green
+        pygame.draw.rect(self.screen, (150, 75, 0), second_button)  # Brown
+
+        first_label, second_label = self.button_labels
+        self.screen.blit(text_cache.render(first_label, (0, 0, 0)), (x + 10, y + 10))  # Black
+        self.screen.blit(text_cache.render(second_label, (0, 0, 0)), (x + self.button_width + 20, y + 10))
+
+        return first_button, second_button
+
+    def _list_rect(self) -> pygame.Rect:
+        """The area covered by the visible items."""
+        return pygame.Rect(0, self.LIST_TOP, self.screen.get_width(), self.max_visible_items * self.ITEM_HEIGHT).clip(
+            self.screen.get_rect()
+        )
+
+    def _redraw(self, visible_items: list[tuple[str, int]], message: str | None) -> None:
+        """Draw the whole offscreen surface."""
+        self.screen.fill((0, 0, 0))  # Solid Black background
+
+        # Reset button actions
+        self.button_actions = {}
+
+        y_offset = self.LIST_TOP
+        for item, quantity in visible_items:
+            # Draw icon
+            if item in self.icons:
+                self.screen.blit(self.icons[item], (self.LIST_LEFT, y_offset))
+
+            # Draw quantity next to the icon
+            text_cache.blit_glyphs(self.screen, f"x{quantity}", (100, y_offset + 5), (255, 255, 255))
+
+            # Draw item name (move text to the right)
+            text = text_cache.render(item, (255, 255, 255))
+            self.screen.blit(text, (150, y_offset))
+
+            # Store button references for event handling
+            self.button_actions[item] = self.draw_buttons(self.BUTTONS_LEFT, y_offset, item)
+            y_offset += self.ITEM_HEIGHT  # Move down for the next item
+
+        # Draw a hint
+        hint_text = text_cache.render(self.hint, (200, 200, 200))  # Light gray text
+        self.screen.blit(hint_text, (self.LIST_LEFT, self.screen.get_height() - 60))
+
+        # Display an action message above the hint
+        self._message_rect = None
+        if message is not None:
+            message_text = text_cache.render(message, (255, 255, 0))  # Yellow
+            text_width, text_height = message_text.get_size()
+
+            # Draw background rectangle for the message, with padding, and the message on top of it
+            self._message_rect = pygame.Rect(40, self.screen.get_height() - 120, text_width + 20, text_height + 10)
+            pygame.draw.rect(self.screen, (0, 0, 0), self._message_rect)  # Black background
+            self.screen.blit(message_text, (self._message_rect.x + 10, self._message_rect.y + 5))
+
+    def render(self, screen: pygame.Surface) -> None:
+        """Draw the overlay, copying only the areas that changed since the last frame to the display."""
+        items = list(self.inventory.items.items())
+        visible_items = items[self.scroll_offset : self.scroll_offset + self.max_visible_items]
+        message = self.message if self.message and pygame.time.get_ticks() < self.message_end_time else None
+
+        # The profiler overlay of the last frame was drawn over this state: repaint it so the next one
+        # does not land on top of it, the game loop presents that area with the overlay
+        if profiler.drawn_rect is not None:
+            screen.blit(self.screen, profiler.drawn_rect, profiler.drawn_rect)
+
+        items_changed = tuple(visible_items) != self._drawn_items
+        message_changed = message != self._drawn_message
+        self.dirty_rects = []
+        if not (items_changed or message_changed or not self._presented):
+            return
+
+        previous_message_rect = self._message_rect
+        self._redraw(visible_items, message)
+        self._drawn_items, self._drawn_message = tuple(visible_items), message
+
+        if not self._presented:
+            self.dirty_rects.append(self.screen.get_rect())
+            self._presented = True
+        else:
+            if items_changed:
+                self.dirty_rects.append(self._list_rect())
+            if message_changed:
+                self.dirty_rects.extend(rect for rect in (previous_message_rect, self._message_rect) if rect)
+
+        # blit the changed areas of the tmp self.screen to the actual display (screen forms the argument)
+        for rect in self.dirty_rects:
+            screen.blit(self.screen, rect, rect)
+        pygame.display.update(self.dirty_rects)
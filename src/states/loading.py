@@ -0,0 +1,60 @@
+"""
+loading state
+shown at startup while the images are decoded
+"""
+
+from collections.abc import Callable
+
+import pygame  # type: ignore
+
+from src.states.base_state import BaseState
+from src.support import preload_images, release_images
+from src.utils.text_cache import text_cache
+
+
+class Loading(BaseState):
+    """
+    Shows the progress of the images decoded in the background, then builds the next state
+    (which converts the decoded images on the main thread) and replaces itself with it.
+    The images the state did not use are released then, so they do not stay in memory.
+    """
+
+    BAR_SIZE = (400, 24)
+
+    def __init__(self, game_state_manager, image_paths: list[str], build_state: Callable[[], BaseState]) -> None:
+        super().__init__(game_state_manager)
+        self.image_paths = image_paths
+        self.futures = preload_images(image_paths)
+        self.build_state = build_state
+        self.progress = 0.0
+        self.building = False  # set once the decoding is done, so the last frame shows it before the build blocks
+
+    def update(self, events):
+        """
+        follow the decoding, and switch to the built state once it is over
+        """
+        done = sum(future.done() for future in self.futures)
+        self.progress = done / len(self.futures) if self.futures else 1.0
+        if done < len(self.futures):
+            return
+        if not self.building:
+            self.building = True
+            return
+
+        state = self.build_state()
+        release_images(self.image_paths)
+        self.game_state_manager.exit_state()
+        self.game_state_manager.enter_state(state)
+
+    def render(self, screen: pygame.Surface) -> None:
+        screen.fill((0, 0, 0))
+        label = text_cache.render("Building the world..." if self.building else "Loading...", (255, 255, 255))
+        center_x, center_y = screen.get_rect().center
+        screen.blit(label, label.get_rect(midbottom=(center_x, center_y - 10)))
+
+        bar = pygame.Rect((0, 0), self.BAR_SIZE)
+        bar.midtop = (center_x, center_y)
+        pygame.draw.rect(screen, (255, 255, 255), bar, 2)
+        pygame.draw.rect(screen, (0, 255, 0), (bar.x, bar.y, bar.width * self.progress, bar.height))
+
+        pygame.display.update()
@@ -1,62 +1,103 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from os import walk
-from os.path import join
+from os.path import join, normpath
 
 import pygame  # type: ignore
 
 # from pytmx.util_pygame import load_pygame
 
+# Images are decoded by a pool of threads (pygame releases the GIL while decoding a PNG),
+# and converted to the display format on the main thread, which owns the display.
+_decoder = ThreadPoolExecutor(thread_name_prefix="decode")
+_decoding: dict[str, Future] = {}
+
+
+def preload_images(paths):
+    """Start decoding the images at `paths` in the background, return the futures of the decoded surfaces."""
+    futures = []
+    for path in paths:
+        future = _decoding.get(normpath(path))
+        if future is None:
+            future = _decoding[normpath(path)] = _decoder.submit(pygame.image.load, path)
+        futures.append(future)
+    return futures
+
+
+def decode_images(paths):
+    """Return the images at `paths` decoded in parallel, reusing the decoding started by `preload_images`."""
+    futures = preload_images(paths)
+    for path in paths:
+        _decoding.pop(normpath(path), None)
+    return [future.result() for future in futures]
+
+
+def release_images(paths):
+    """Forget the decoding started by `preload_images` for `paths`, freeing the images that were never used."""
+    for path in paths:
+        future = _decoding.pop(normpath(path), None)
+        if future is not None:
+            future.cancel()
+
+
+def load_images(paths, alpha=True):
+    """Decode the images at `paths` in parallel and convert them to the display format."""
+    return [image.convert_alpha() if alpha else image.convert() for image in decode_images(paths)]
+
+
+def folder_paths(*path):
+    """The paths of the images of a folder of animation frames, named by their index, in order."""
+    paths = []
+    for folder_path, sub_folders, image_names in walk(join(*path)):
+        for image_name in sorted(image_names, key=lambda name: int(name.split(".")[0])):
+            paths.append(join(folder_path, image_name))
+    return paths
+
 
 # imports
 def import_image(*path, alpha=True, format="png"):
     full_path = join(*path) + f".{format}"
-    surf = pygame.image.load(full_path).convert_alpha() if alpha else pygame.image.load(full_path).convert()
-    return surf
+    return load_images([full_path], alpha)[0]
 
 
 def import_folder(*path):
-    frames = []
-    for folder_path, sub_folders, image_names in walk(join(*path)):
-        for image_name in sorted(image_names, key=lambda name: int(name.split(".")[0])):
-            full_path = join(folder_path, image_name)
-            surf = pygame.image.load(full_path).convert_alpha()
-            frames.append(surf)
-    return frames
+    return load_images(folder_paths(*path))
 
 
 def import_folder_dict(*path):
-    frames = {}
+    paths = {}
     for folder_path, sub_folders, image_names in walk(join(*path)):
         for image_name in image_names:
-            full_path = join(folder_path, image_name)
-            surf = pygame.image.load(full_path).convert_alpha()
-            frames[image_name.split(".")[0]] = surf
-    return frames
+            paths[image_name.split(".")[0]] = join(folder_path, image_name)
+    return dict(zip(paths, load_images(list(paths.values()))))
 
 
 def import_sub_folders(*path):
-    frames = {}
+    folders = {}
     for _, sub_folders, __ in walk(join(*path)):
         if sub_folders:
             for sub_folder in sub_folders:
-                frames[sub_folder] = import_folder(*path, sub_folder)
-    return frames
+                folders[sub_folder] = folder_paths(*path, sub_folder)
 
+    # Decode the frames of every folder together
+    images = iter(load_images([image_path for paths in folders.values() for image_path in paths]))
+    return {sub_folder: [next(images) for _ in paths] for sub_folder, paths in folders.items()}
 
-def import_tilemap(cols, rows, *path):
+
+def cut_tilemap(surf, cols, rows):
+    """Cut a sheet into `cols` x `rows` cells, subsurfaces sharing the pixels of the sheet."""
     frames = {}
-    surf = import_image(*path)
     cell_width, cell_height = surf.get_width() / cols, surf.get_height() / rows
     for col in range(cols):
         for row in range(rows):
             cutout_rect = pygame.Rect(col * cell_width, row * cell_height, cell_width, cell_height)
-            cutout_surf = pygame.Surface((cell_width, cell_height))
-            cutout_surf.fill("green")
-            cutout_surf.set_colorkey("green")
-            cutout_surf.blit(surf, (0, 0), cutout_rect)
-            frames[(col, row)] = cutout_surf
+            frames[(col, row)] = surf.subsurface(cutout_rect)
     return frames
 
 
+def import_tilemap(cols, rows, *path):
+    return cut_tilemap(import_image(*path), cols, rows)
+
+
 def coast_importer(cols, rows, *path):
     frame_dict = import_tilemap(cols, rows, *path)
     new_dict: dict[str, dict] = {}
@@ -78,8 +119,8 @@ def coast_importer(cols, rows, *path):
     return new_dict
 
 
-def character_importer(cols, rows, *path):
-    frame_dict = import_tilemap(cols, rows, *path)
+def character_frames(surf, cols, rows):
+    frame_dict = cut_tilemap(surf, cols, rows)
     new_dict = {}
     for row, direction in enumerate(("down", "left", "right", "up")):
         new_dict[direction] = [frame_dict[(col, row)] for col in range(cols)]
@@ -87,10 +128,21 @@ def character_importer(cols, rows, *path):
     return new_dict
 
 
-def all_character_import(*path):
-    new_dict = {}
+def character_importer(cols, rows, *path):
+    return character_frames(import_image(*path), cols, rows)
+
+
+def character_paths(*path):
+    """The paths of the character sheets of a folder, by character name."""
+    paths = {}
     for _, _, image_names in walk(join(*path)):
         for image in image_names:
-            image_name = image.split(".")[0]
-            new_dict[image_name] = character_importer(7, 4, *path, image_name)
-    return new_dict
+            paths[image.split(".")[0]] = join(*path, image)
+    return paths
+
+
+def all_character_import(*path):
+    # Decode every sheet together
+    paths = character_paths(*path)
+    sheets = load_images(list(paths.values()))
+    return {image_name: character_frames(sheet, 7, 4) for image_name, sheet in zip(paths, sheets)}
@@ -0,0 +1,85 @@
+"""
+Process-wide image registry.
+
+`assets` is the `AssetRegistry` of the game. Every image is decoded from disk once, converted to the
+display format, and shared: the states opening and closing menus ask the registry for their icons
+instead of loading the sprite sheets again. The icon sets are described in `data/icons.json`.
+"""
+
+import json
+import os
+
+import pygame  # type: ignore
+from pygame import Surface  # type: ignore
+
+from src.support import decode_images
+
+ICONS_PATH = os.path.join("data", "icons.json")
+
+
+class AssetRegistry:
+    """
+    Loads images once and hands out shared surfaces and subsurfaces of them.
+
+    The returned surfaces are shared between callers and must not be drawn on.
+    """
+
+    def __init__(self, icons_path: str = ICONS_PATH) -> None:
+        self.icons_path = icons_path
+        self._images: dict[tuple[str, bool], Surface] = {}
+        self._subsurfaces: dict[tuple[str, tuple[int, int, int, int]], Surface] = {}
+        self._icon_sets: dict[str, dict[str, Surface]] = {}
+        self._icon_data: dict[str, dict] | None = None
+
+    def image(self, path: str, alpha: bool = True) -> Surface:
+        """
+        Return the image at `path`, decoded the first time only.
+
+        The image is converted to the display format (with its transparency if `alpha`),
+        when a display mode is set.
+        """
+        key = (os.path.normpath(path), alpha)
+        image = self._images.get(key)
+        if image is None:
+            image = decode_images([path])[0]
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if alpha else image.convert()
+            self._images[key] = image
+        return image
+
+    def subsurface(self, path: str, rect: tuple[int, int, int, int]) -> Surface:
+        """Return the area `rect` of the image at `path`, sharing its pixels."""
+        key = (os.path.normpath(path), rect)
+        subsurface = self._subsurfaces.get(key)
+        if subsurface is None:
+            subsurface = self._subsurfaces[key] = self.image(path).subsurface(rect)
+        return subsurface
+
+    def icons(self, name: str) -> dict[str, Surface]:
+        """
+        Return the icons of the set `name` of the icons file, by item name.
+
+        Raises:
+            KeyError: If the icons file has no set called `name`.
+        """
+        icons = self._icon_sets.get(name)
+        if icons is None:
+            if self._icon_data is None:
+                with open(self.icons_path, "r", encoding="utf-8") as f:
+                    self._icon_data = json.load(f)
+            icon_set = self._icon_data[name]
+            path, size = icon_set["image"], icon_set["size"]
+            icons = self._icon_sets[name] = {
+                item: self.subsurface(path, (x, y, size, size)) for item, (x, y) in icon_set["icons"].items()
+            }
+        return icons
+
+    def clear(self) -> None:
+        """Forget every loaded image, for example after the display mode changed."""
+        self._images.clear()
+        self._subsurfaces.clear()
+        self._icon_sets.clear()
+        self._icon_data = None
+
+
+assets = AssetRegistry()
@@ -1,12 +1,71 @@
 import json
+import os
+import time
+from collections.abc import Callable
+
+ERROR_MESSAGE = "An error occurred while retrieving the message."
+
+
+class MessageCatalog:
+    """
+    The messages of `data/messages.json`, loaded once and kept in memory.
+
+    The templates are stored as bound `str.format` methods, ready to be called.
+    The file is reloaded when its modification time changes, checked at most once every `reload_interval`
+    seconds, so editing the messages while the game runs does not need a restart.
+    """
+
+    def __init__(self, path: str = os.path.join("data", "messages.json"), reload_interval: float = 1.0) -> None:
+        self.path = path
+        self.reload_interval = reload_interval
+        self.templates: dict[tuple[str, str], Callable[..., str]] = {}
+        self._mtime: float | None = None
+        self._last_check: float | None = None
+
+    def _check_reload(self) -> None:
+        now = time.monotonic()
+        if self._last_check is not None and now - self._last_check < self.reload_interval:
+            return
+        self._last_check = now
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            self.templates, self._mtime = {}, None
+            return
+        if mtime != self._mtime:
+            self.load()
+
+    def load(self) -> None:
+        """Read the messages file, replacing every template. A missing or invalid file leaves the catalog empty."""
+        try:
+            mtime = os.path.getmtime(self.path)
+            with open(self.path, "r", encoding="utf-8") as f:
+                messages = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.templates, self._mtime = {}, None
+            return
+        self.templates = {
+            (category, key): template.format
+            for category, entries in messages.items()
+            for key, template in entries.items()
+        }
+        self._mtime = mtime
+
+    def get(self, category: str, key: str, **kwargs) -> str:
+        """Format the message `key` of `category` with `kwargs`."""
+        self._check_reload()
+        template = self.templates.get((category, key))
+        if template is None:
+            return ERROR_MESSAGE
+        try:
+            return template(**kwargs)
+        except KeyError:
+            return ERROR_MESSAGE
+
+
+catalog = MessageCatalog()
 
 
 def get_message(category: str, key: str, **kwargs) -> str:
-    """Retrieve and format a message from the JSON file."""
-    try:
-        with open("data/messages.json", "r") as f:
-            messages = json.load(f)
-        message = messages[category][key]
-        return message.format(**kwargs)
-    except (KeyError, FileNotFoundError):
-        return "An error occurred while retrieving the message."
+    """Retrieve and format a message from the in-memory catalog of the JSON file."""
+    return catalog.get(category, key, **kwargs)
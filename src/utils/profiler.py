@@ -0,0 +1,161 @@
+"""
+Frame-time instrumentation.
+
+`profiler` is the shared `FrameProfiler` of the game. The main loop marks the frames, and the subsystems
+time themselves with `with profiler.section("name"):`. The last `capacity` frames are kept in NumPy ring
+buffers, shown by a toggleable overlay with the p50/p95/p99 frame times, and can be dumped to CSV.
+"""
+
+import csv
+import os
+import time
+
+import numpy as np
+import pygame  # type: ignore
+from pygame import Surface  # type: ignore
+
+from src.settings import FPS
+from src.utils.text_cache import text_cache
+
+PROFILE_DIR = os.path.join("data", "profiles")
+
+
+class _Section:
+    """Context manager adding the time spent in its block to one section of the current frame."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Section":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + time.perf_counter() - self.start
+
+
+class FrameProfiler:
+    """
+    Records the duration of each frame and of the named sections run during it, in milliseconds.
+
+    Attributes:
+        capacity (int): The number of frames kept.
+        visible (bool): Whether `draw` renders the overlay.
+        history (dict[str, np.ndarray]): Ring buffer per series, "frame" holds the whole frames.
+        current (dict[str, float]): Seconds spent in each section since `begin_frame`.
+        drawn_rect (pygame.Rect | None): The area covered by the overlay on the last `draw`, None if hidden.
+            States that only repaint what changed must repaint it too, the overlay is drawn over them.
+    """
+
+    GRAPH_SIZE = (240, 60)
+    GRAPH_BUDGET_MS = 1000 / FPS  # top of the graph, the frame budget of the game
+    FONT_SIZE = 18
+
+    def __init__(self, capacity: int = 600) -> None:
+        self.capacity = capacity
+        self.visible = False
+        self.history: dict[str, np.ndarray] = {"frame": np.zeros(capacity)}
+        self.current: dict[str, float] = {}
+        self.count = 0  # frames recorded, the ring buffers are full once it reaches `capacity`
+        self._index = 0
+        self._frame_start: float | None = None
+        self._sections: dict[str, _Section] = {}
+        self.drawn_rect: pygame.Rect | None = None
+
+    def section(self, name: str) -> _Section:
+        """Return a context manager timing its block as part of the section `name`."""
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def begin_frame(self) -> None:
+        self._frame_start = time.perf_counter()
+        self.current = {}
+
+    def end_frame(self) -> None:
+        """Store the frame started by `begin_frame` in the ring buffers."""
+        if self._frame_start is None:
+            return
+        self.current["frame"] = time.perf_counter() - self._frame_start
+        self._frame_start = None
+
+        index = self._index
+        for name in self.current:
+            if name not in self.history:
+                self.history[name] = np.zeros(self.capacity)
+        for name, series in self.history.items():
+            series[index] = self.current.get(name, 0.0) * 1000
+        self._index = (index + 1) % self.capacity
+        self.count += 1
+
+    def samples(self, name: str = "frame") -> np.ndarray:
+        """Return the recorded values of a series in milliseconds, oldest first."""
+        series = self.history.get(name)
+        if series is None:
+            return np.zeros(0)
+        if self.count < self.capacity:
+            return series[: self.count].copy()
+        return np.roll(series, -self._index)
+
+    def percentiles(self, name: str = "frame") -> dict[str, float]:
+        """Return the p50, p95 and p99 of a series in milliseconds, zeros if nothing was recorded."""
+        samples = self.samples(name)
+        if samples.size == 0:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+        return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+    def dump_csv(self, path: str | None = None) -> str:
+        """Write one row per recorded frame, one column per series, and return the path of the file."""
+        if path is None:
+            path = os.path.join(PROFILE_DIR, f"frames_{time.strftime('%Y%m%d_%H%M%S')}.csv")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        names = list(self.history)
+        columns = np.column_stack([self.samples(name) for name in names])
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow([f"{name}_ms" for name in names])
+            writer.writerows(np.round(columns, 4).tolist())
+        return path
+
+    def draw(self, surface: Surface, pos: tuple[int, int] = (10, 10)) -> pygame.Rect | None:
+        """Draw the frame-time graph and the percentiles, return the area drawn on, None if hidden."""
+        if not self.visible:
+            self.drawn_rect = None
+            return None
+        names = [name for name in self.history if name != "frame"]
+        width, graph_height = self.GRAPH_SIZE
+        line_height = text_cache.font(self.FONT_SIZE).get_linesize()
+        overlay = pygame.Surface((width, graph_height + line_height * (len(names) + 1) + 4), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+
+        frames = self.samples()[-width:]
+        heights = np.minimum(frames / self.GRAPH_BUDGET_MS, 1.0) * graph_height
+        for x, (frame_ms, height) in enumerate(zip(frames.tolist(), heights.tolist())):
+            if frame_ms <= self.GRAPH_BUDGET_MS / 2:
+                color = "green"
+            elif frame_ms <= self.GRAPH_BUDGET_MS:
+                color = "yellow"
+            else:
+                color = "red"
+            pygame.draw.line(overlay, color, (x, graph_height - 1), (x, graph_height - 1 - int(height)))
+
+        stats = self.percentiles()
+        lines = [f"frame p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f} ms"]
+        lines += [f"{name} p50 {self.percentiles(name)['p50']:.2f} ms" for name in names]
+        for row, text in enumerate(lines):
+            # The numbers change every frame, compose them from cached glyphs rather than rendering new strings
+            text_cache.blit_glyphs(overlay, text, (4, graph_height + 2 + row * line_height), "white", self.FONT_SIZE)
+        self.drawn_rect = surface.blit(overlay, pos)
+        return self.drawn_rect
+
+
+profiler = FrameProfiler()
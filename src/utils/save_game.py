@@ -0,0 +1,228 @@
+"""
+Versioned binary snapshots of a game session, for quick-save and quick-load.
+
+A save file is a fixed header (magic, format version, CRC32 of the payload) followed by a payload packed
+with `struct`: the player position and path, the inventory, and the walkability matrix of the map,
+compressed with zlib. Snapshots are encoded and written by a background thread, so saving never stalls
+the frame loop, and files are replaced atomically so a crash mid-write keeps the previous save.
+"""
+
+import os
+import struct
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.inventory import Chest, Inventory, Quest
+
+SAVE_MAGIC = b"PCSV"
+SAVE_VERSION = 1
+QUICK_SAVE_PATH = os.path.join("data", "saves", "quicksave.sav")
+
+_HEADER = struct.Struct("<4sHI")  # magic, version, crc32 of the payload
+_POSITION = struct.Struct("<ff")
+_COUNT = struct.Struct("<I")
+_STRING_LENGTH = struct.Struct("<H")
+_QUANTITY = struct.Struct("<q")
+_FLAG = struct.Struct("<?")
+_GRID_SHAPE = struct.Struct("<II")
+
+
+class SaveError(ValueError):
+    """Raised when a save file is not a valid snapshot, or was written by an unsupported version."""
+
+
+@dataclass
+class GameSnapshot:
+    """The state of a session, copied so it can be encoded while the game keeps running."""
+
+    player_pos: tuple[float, float]
+    player_path: list[tuple[int, int]] = field(default_factory=list)
+    money: int = 0
+    items: dict[str, int] = field(default_factory=dict)
+    chests: list[str] = field(default_factory=list)
+    quests: list[bool] = field(default_factory=list)
+    show_grid: bool = True
+    grid_matrix: np.ndarray | None = None
+
+    @classmethod
+    def capture(cls, player, inventory: Inventory, grid_manager=None, show_grid: bool = True) -> "GameSnapshot":
+        """Copy the state of the player, the inventory and the grid manager."""
+        return cls(
+            player_pos=(float(player.rect.x), float(player.rect.y)),
+            # The tile the player is heading to first, or a restored trip would cut straight to the next one
+            player_path=[(int(x), int(y)) for x, y in player.waypoints],
+            money=inventory.money,
+            items=dict(inventory.items),
+            chests=[chest.name for chest in inventory.chests],
+            quests=[quest.completed for quest in inventory.quests],
+            show_grid=show_grid,
+            grid_matrix=None if grid_manager is None else np.array(grid_manager.grid_matrix),
+        )
+
+    def restore(self, player, inventory: Inventory, grid_manager=None) -> None:
+        """Write the snapshot back into the player, the inventory and the grid manager."""
+        player.rect.topleft = self.player_pos
+        player.path = [[x, y] for x, y in self.player_path]
+
+        inventory.money = self.money
+        inventory.items = dict(self.items)
+        inventory.chests = [Chest(name) for name in self.chests]
+        inventory.quests = []
+        for completed in self.quests:
+            quest = Quest()
+            quest.completed = completed
+            inventory.quests.append(quest)
+
+        if grid_manager is not None and self.grid_matrix is not None:
+            grid_manager.grid_matrix = np.array(self.grid_matrix)
+
+
+def _pack_string(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return _STRING_LENGTH.pack(len(data)) + data
+
+
+def encode_snapshot(snapshot: GameSnapshot) -> bytes:
+    """Pack a snapshot into the binary save format."""
+    parts = [_POSITION.pack(*snapshot.player_pos), _COUNT.pack(len(snapshot.player_path))]
+    parts.append(np.asarray(snapshot.player_path, dtype="<i4").reshape(-1, 2).tobytes())
+
+    parts.append(_QUANTITY.pack(snapshot.money))
+    parts.append(_COUNT.pack(len(snapshot.items)))
+    for item_name, quantity in snapshot.items.items():
+        parts.append(_pack_string(item_name))
+        parts.append(_QUANTITY.pack(quantity))
+    parts.append(_COUNT.pack(len(snapshot.chests)))
+    parts.extend(_pack_string(name) for name in snapshot.chests)
+    parts.append(_COUNT.pack(len(snapshot.quests)))
+    parts.append(bytes(snapshot.quests))
+    parts.append(_FLAG.pack(snapshot.show_grid))
+
+    if snapshot.grid_matrix is None:
+        parts.append(_GRID_SHAPE.pack(0, 0))
+    else:
+        height, width = snapshot.grid_matrix.shape
+        grid_data = zlib.compress(np.ascontiguousarray(snapshot.grid_matrix, dtype="<i4").tobytes(), 1)
+        parts.extend((_GRID_SHAPE.pack(height, width), _COUNT.pack(len(grid_data)), grid_data))
+
+    payload = b"".join(parts)
+    return _HEADER.pack(SAVE_MAGIC, SAVE_VERSION, zlib.crc32(payload)) + payload
+
+
+class _Reader:
+    """Sequential reader over a payload, raising SaveError when it runs out of bytes."""
+
+    def __init__(self, data: bytes, offset: int) -> None:
+        self.data = data
+        self.offset = offset
+
+    def take(self, size: int) -> bytes:
+        if self.offset + size > len(self.data):
+            raise SaveError("The save file is truncated")
+        chunk = self.data[self.offset : self.offset + size]
+        self.offset += size
+        return chunk
+
+    def unpack(self, layout: struct.Struct) -> tuple:
+        return layout.unpack(self.take(layout.size))
+
+    def string(self) -> str:
+        (length,) = self.unpack(_STRING_LENGTH)
+        return self.take(length).decode("utf-8")
+
+
+def decode_snapshot(data: bytes) -> GameSnapshot:
+    """Unpack a snapshot, raises SaveError if the data is not a valid save of a supported version."""
+    if len(data) < _HEADER.size:
+        raise SaveError("The save file is truncated")
+    magic, version, checksum = _HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise SaveError("Not a save file")
+    if version != SAVE_VERSION:
+        raise SaveError(f"Unsupported save version {version}")
+    if zlib.crc32(memoryview(data)[_HEADER.size :]) != checksum:
+        raise SaveError("The save file is corrupted")
+
+    reader = _Reader(data, _HEADER.size)
+    player_pos = reader.unpack(_POSITION)
+    (path_length,) = reader.unpack(_COUNT)
+    path = np.frombuffer(reader.take(path_length * 8), dtype="<i4").reshape(-1, 2)
+    (money,) = reader.unpack(_QUANTITY)
+    (item_count,) = reader.unpack(_COUNT)
+    items = {}
+    for _ in range(item_count):
+        item_name = reader.string()
+        (items[item_name],) = reader.unpack(_QUANTITY)
+    (chest_count,) = reader.unpack(_COUNT)
+    chests = [reader.string() for _ in range(chest_count)]
+    (quest_count,) = reader.unpack(_COUNT)
+    quests = [bool(completed) for completed in reader.take(quest_count)]
+    (show_grid,) = reader.unpack(_FLAG)
+
+    grid_matrix = None
+    height, width = reader.unpack(_GRID_SHAPE)
+    if height and width:
+        (length,) = reader.unpack(_COUNT)
+        grid_data = zlib.decompress(reader.take(length))
+        grid_matrix = np.frombuffer(grid_data, dtype="<i4").reshape(height, width).astype(int)
+
+    return GameSnapshot(
+        player_pos=(player_pos[0], player_pos[1]),
+        player_path=[(int(x), int(y)) for x, y in path.tolist()],
+        money=money,
+        items=items,
+        chests=chests,
+        quests=quests,
+        show_grid=show_grid,
+        grid_matrix=grid_matrix,
+    )
+
+
+class SaveManager:
+    """
+    Writes snapshots from a single background thread, in the order they were requested.
+
+    Loading waits for the pending writes first, so a quick-load right after a quick-save
+    always reads the snapshot that was just saved.
+    """
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._pending: list[Future] = []
+
+    def save(self, snapshot: GameSnapshot, path: str = QUICK_SAVE_PATH) -> Future:
+        """Encode and write `snapshot` in the background, return the future of the write."""
+        self._pending = [future for future in self._pending if not future.done()]
+        future = self._executor.submit(self._write, snapshot, path)
+        self._pending.append(future)
+        return future
+
+    @staticmethod
+    def _write(snapshot: GameSnapshot, path: str) -> None:
+        data = encode_snapshot(snapshot)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(data)
+        os.replace(temporary_path, path)
+
+    def wait(self) -> None:
+        """Block until every pending write is on disk, re-raising the error of a failed write."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def load(self, path: str = QUICK_SAVE_PATH) -> GameSnapshot:
+        """Read the snapshot at `path`, raises FileNotFoundError or SaveError."""
+        self.wait()
+        with open(path, "rb") as file:
+            return decode_snapshot(file.read())
+
+    def shutdown(self) -> None:
+        """Finish the pending writes and stop the background thread."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,125 @@
+"""
+Shared text rendering.
+
+`text_cache` is the `TextCache` of the game, used by every UI state instead of their own `pygame.font.Font`.
+Rendered strings are kept in an LRU cache keyed on (font, size, text, color, antialias), so a label drawn
+every frame is rasterized once. Text changing every frame, like the numbers of the profiler overlay, goes
+through `blit_glyphs` instead, which composes the string from cached single characters.
+"""
+
+from collections import OrderedDict
+
+import pygame  # type: ignore
+from pygame import Surface  # type: ignore
+
+DEFAULT_FONT_SIZE = 36
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces, and of the glyphs composing frequently changing text.
+
+    The returned surfaces are shared between callers and must not be drawn on.
+
+    Attributes:
+        capacity (int): The number of rendered strings kept, the least recently used are dropped first.
+        hits (int): `render` calls served from the cache.
+        misses (int): `render` calls that had to rasterize the text.
+    """
+
+    def __init__(self, capacity: int = 512) -> None:
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+        self._surfaces: OrderedDict[tuple, Surface] = OrderedDict()
+        self._glyphs: dict[tuple, tuple[Surface, int]] = {}
+
+    def font(self, size: int = DEFAULT_FONT_SIZE, name: str | None = None) -> pygame.font.Font:
+        """Return the font file `name` (pygame's default font if None) at `size`, loaded once."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            try:
+                font.get_height()
+            except pygame.error:
+                # The fonts loaded before a `pygame.quit()` are invalid, load them again
+                self._fonts.clear()
+                font = None
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def _rasterize(self, text: str, antialias: bool, color, size: int, name: str | None) -> Surface:
+        return self.font(size, name).render(text, antialias, color)
+
+    def render(
+        self,
+        text: str,
+        color,
+        size: int = DEFAULT_FONT_SIZE,
+        name: str | None = None,
+        antialias: bool = True,
+    ) -> Surface:
+        """Return `text` rendered like `Font.render`, rasterizing it only the first time it is asked for."""
+        key = (name, size, text, tuple(pygame.Color(color)), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = self._rasterize(text, antialias, color, size, name)
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def _glyph(self, char: str, color: tuple, size: int, name: str | None, antialias: bool) -> tuple[Surface, int]:
+        """Return a single character rendered, and the horizontal advance of the font for it."""
+        key = (name, size, char, color, antialias)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            surface = self._rasterize(char, antialias, color, size, name)
+            metrics = self.font(size, name).metrics(char)[0]
+            advance = metrics[4] if metrics is not None else surface.get_width()
+            glyph = self._glyphs[key] = (surface, advance)
+        return glyph
+
+    def blit_glyphs(
+        self,
+        surface: Surface,
+        text: str,
+        pos: tuple[int, int],
+        color,
+        size: int = DEFAULT_FONT_SIZE,
+        name: str | None = None,
+        antialias: bool = True,
+    ) -> pygame.Rect:
+        """
+        Draw `text` on `surface` at `pos` one cached character at a time, and return the area drawn on.
+
+        Meant for numbers and short readouts changing every frame (quantities, frame times), which would
+        otherwise fill the LRU cache with strings drawn once. Kerning is not applied.
+        """
+        color = tuple(pygame.Color(color))
+        x, y = pos
+        height = 0
+        blits = []
+        for char in text:
+            glyph, advance = self._glyph(char, color, size, name, antialias)
+            blits.append((glyph, (x, y)))
+            x += advance
+            height = max(height, glyph.get_height())
+        surface.fblits(blits)
+        return pygame.Rect(pos[0], y, x - pos[0], height)
+
+    def clear(self) -> None:
+        """Drop every rendered string and glyph, the fonts stay loaded."""
+        self._surfaces.clear()
+        self._glyphs.clear()
+
+
+text_cache = TextCache()
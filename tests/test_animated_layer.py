@@ -0,0 +1,89 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from types import SimpleNamespace
+from typing import cast
+
+import numpy as np
+import pygame
+import pytest
+
+from src.settings import ANIMATION_SPEED, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.sprites.animations import AnimatedSprites, AnimationRegistry
+from src.sprites.camera.player_camera import PlayerCamera
+from src.sprites.tiles.animated_layer import AnimatedTileLayer
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_init():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    yield
+    pygame.quit()
+
+
+def make_frames(count, shade):
+    frames = []
+    for index in range(count):
+        frame = pygame.Surface((16, 16))
+        frame.fill((shade, 40 * index, 0))
+        frame.fill((0, 0, 255), (3, 5, 4, 2))  # a detail, to catch misplaced or flipped tiles
+        frames.append(frame)
+    return frames
+
+
+def test_tiles_are_stored_as_columns():
+    water, coast = make_frames(4, 50), make_frames(2, 200)
+    registry = AnimationRegistry()
+    layer = AnimatedTileLayer([(0, 0, water), (16, 0, coast), (32, 48, water)], registry)
+
+    assert len(layer) == 3
+    assert layer.frame_set.tolist() == [0, 1, 0]
+    assert [timeline.frames for timeline in layer.timelines] == [water, coast]
+    assert layer.timelines[0] is registry.timeline(water)
+    assert layer.rect == pygame.FRect(0, 0, 48, 64)
+
+
+@pytest.mark.parametrize("scale", [1.0, 2.0, 2.7])
+def test_layer_draws_like_animated_sprites(scale):
+    rng = np.random.default_rng(0)
+    frame_sets = [make_frames(4, 50), make_frames(3, 200)]
+    tiles = [(int(x) * 16, int(y) * 16, frame_sets[int(s)]) for x, y, s in rng.integers(0, (40, 30, 2), (300, 3))]
+    center = (320, 240)
+
+    # The same tiles, as one sprite each and as a layer, each drawn by its own camera
+    surfaces = []
+    for as_layer in (False, True):
+        registry = AnimationRegistry()
+        group: pygame.sprite.Group = pygame.sprite.Group()
+        if as_layer:
+            AnimatedTileLayer(tiles, registry, (group,))
+        else:
+            for x, y, frames in tiles:
+                AnimatedSprites((x, y), frames, (group,))
+        camera = PlayerCamera(SimpleNamespace(width=40, height=30), center)
+        camera.add(*group)
+        camera.scale = scale
+        registry.update(5 / ANIMATION_SPEED)
+        camera.update(5 / ANIMATION_SPEED)
+
+        assert camera.display_surface is not None
+        camera.display_surface.fill("black")
+        camera.draw(center)
+        surfaces.append(pygame.surfarray.array3d(camera.display_surface))
+
+    assert np.array_equal(surfaces[0], surfaces[1])
+
+
+def test_tiles_outside_the_view_are_skipped():
+    frames = make_frames(1, 50)
+    layer = AnimatedTileLayer([(0, 0, frames), (1000, 1000, frames)], AnimationRegistry())
+    blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+    surface = cast(pygame.Surface, SimpleNamespace(fblits=blits.extend))  # records the blits
+
+    layer.draw(surface, pygame.math.Vector2(), 1.0, pygame.FRect(0, 0, 64, 64))
+
+    assert blits == [(layer.get_scaled_frames(1.0)[0], (0, 0))]
@@ -0,0 +1,47 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+import pytest
+
+from src.settings import ANIMATION_SPEED
+from src.sprites.animations import AnimatedSprites, AnimationRegistry
+
+
+@pytest.fixture
+def frames():
+    return [pygame.Surface((16, 16)) for _ in range(4)]
+
+
+def test_registry_shares_one_timeline_per_frame_set(frames):
+    registry = AnimationRegistry()
+    timeline = registry.timeline(frames)
+
+    assert registry.timeline(list(frames)) is timeline
+    assert registry.timeline(frames[:2]) is not timeline
+    assert len(registry.timelines) == 2
+
+
+def test_timeline_matches_per_sprite_animation(frames):
+    registry = AnimationRegistry()
+    timeline = registry.timeline(frames)
+    sprite = AnimatedSprites((0, 0), frames, ())
+
+    for _ in range(10):
+        dt = 0.7 / ANIMATION_SPEED
+        registry.update(dt)
+        sprite.update(dt)
+        assert timeline.current_frame() is sprite.image
+
+
+def test_phase_offsets(frames):
+    registry = AnimationRegistry()
+    timeline = registry.timeline(frames)
+
+    registry.update(1 / ANIMATION_SPEED)  # one frame forward
+
+    assert timeline.current_frame() is frames[1]
+    assert timeline.current_frame(phase=3) is frames[0]
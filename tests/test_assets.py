@@ -0,0 +1,66 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import json
+
+import pygame
+import pytest
+
+from src.utils.assets import ICONS_PATH, AssetRegistry
+
+
+@pytest.fixture
+def sheet_path(tmp_path):
+    sheet = pygame.Surface((32, 16), pygame.SRCALPHA)
+    sheet.fill((255, 0, 0, 255), (0, 0, 16, 16))
+    sheet.fill((0, 0, 255, 128), (16, 0, 16, 16))
+    path = tmp_path / "sheet.png"
+    pygame.image.save(sheet, path)
+    return str(path)
+
+
+@pytest.fixture
+def registry(tmp_path, sheet_path):
+    icons = {"test": {"image": sheet_path, "size": 16, "icons": {"Ruby": [0, 0], "Sapphire": [16, 0]}}}
+    icons_path = tmp_path / "icons.json"
+    icons_path.write_text(json.dumps(icons), encoding="utf-8")
+    return AssetRegistry(str(icons_path))
+
+
+def test_images_are_decoded_once(registry, sheet_path, monkeypatch):
+    image = registry.image(sheet_path)
+
+    def fail(*args):
+        raise AssertionError("the image was loaded again")
+
+    monkeypatch.setattr(pygame.image, "load", fail)
+    assert registry.image(sheet_path) is image
+    assert registry.subsurface(sheet_path, (0, 0, 16, 16)) is registry.subsurface(sheet_path, (0, 0, 16, 16))
+
+
+def test_icons_share_the_sprite_sheet(registry, sheet_path):
+    icons = registry.icons("test")
+
+    assert set(icons) == {"Ruby", "Sapphire"}
+    assert icons["Ruby"].get_parent() is registry.image(sheet_path)
+    assert icons["Ruby"].get_at((0, 0)) == (255, 0, 0, 255)
+    assert icons["Sapphire"].get_at((0, 0)) == (0, 0, 255, 128)
+    assert registry.icons("test") is icons
+
+    with pytest.raises(KeyError):
+        registry.icons("missing")
+
+
+def test_game_icons_fit_their_sprite_sheets():
+    # The game reads its files relative to the project root
+    root = os.path.join(os.path.dirname(__file__), "..")
+    with open(os.path.join(root, ICONS_PATH), "r", encoding="utf-8") as f:
+        icon_sets = json.load(f)
+
+    for icon_set in icon_sets.values():
+        width, height = pygame.image.load(os.path.join(root, icon_set["image"])).get_size()
+        for x, y in icon_set["icons"].values():
+            assert 0 <= x <= width - icon_set["size"] and 0 <= y <= height - icon_set["size"]
@@ -0,0 +1,71 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+
+from src.game_manager import GameStateManager
+from src.states.base_state import BaseState
+
+
+class FakeClock:
+    """Reports a fixed frame time and records the frame caps."""
+
+    def __init__(self, frame_ms: int) -> None:
+        self.frame_ms = frame_ms
+        self.caps: list[int] = []
+
+    def tick(self, framerate: int = 0) -> int:
+        self.caps.append(framerate)
+        return self.frame_ms
+
+    def get_fps(self) -> float:
+        return 0.0
+
+
+class CountingState(BaseState):
+    def __init__(self, game_state_manager, frames: int) -> None:
+        super().__init__(game_state_manager)
+        self.frames = frames
+        self.steps: list[float] = []
+        self.interpolations: list[float] = []
+
+    def update(self, events) -> None:
+        pass
+
+    def fixed_update(self, dt: float) -> None:
+        self.steps.append(dt)
+
+    def render(self, screen) -> None:
+        self.interpolations.append(self.game_state_manager.interpolation)
+        self.frames -= 1
+        if self.frames == 0:
+            self.game_state_manager.running = False
+
+
+@pytest.fixture
+def manager():
+    game_state_manager = GameStateManager()
+    yield game_state_manager
+    game_state_manager.states_stack.clear()
+
+
+def test_fixed_steps_are_taken_from_the_accumulator(manager):
+    manager.clock = FakeClock(25)  # 40 FPS, 1.5 steps of a 60 Hz simulation per frame
+    state = CountingState(manager, frames=4)
+    manager.enter_state(state)
+    manager.run()
+
+    assert state.steps == [manager.fixed_dt] * 6
+    assert state.interpolations == pytest.approx([0.5, 0.0, 0.5, 0.0], abs=1e-6)
+
+
+def test_long_frames_are_clamped(manager):
+    manager.clock = FakeClock(5000)
+    state = CountingState(manager, frames=1)
+    manager.enter_state(state)
+    manager.run()
+
+    assert len(state.steps) == 15  # MAX_FRAME_TIME of 0.25 seconds at 60 Hz
@@ -7,6 +7,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 import numpy as np
 import pygame
 import pytest
+import pytmx
 from hypothesis import given
 from hypothesis import strategies as st
 
@@ -96,6 +97,82 @@ def test_clamp_grid_coordinates(grid_manager):
     assert grid_manager._clamp_grid_coordinates(5, 20) == (5, 9)
 
 
+MAP_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "new_maps", "100x100_map.tmx")
+
+
+@pytest.fixture(scope="module")
+def tmx_map():
+    return pytmx.TiledMap(MAP_PATH)
+
+
+def test_create_grid_matrix_layer_rules(tmx_map):
+    # Reference: the per-tile loops the grid matrix used to be built with
+    expected = np.zeros((tmx_map.height, tmx_map.width), dtype=int)
+    for layer in tmx_map.visible_layers:
+        if isinstance(layer, pytmx.TiledTileLayer) and layer.name in GridManager.LAYER_RULES:
+            for x, y, _ in layer:
+                expected[y, x] = GridManager.LAYER_RULES[layer.name]
+
+    grid_manager = GridManager(tmx_map, tile_size=16)
+    np.testing.assert_array_equal(grid_manager.grid_matrix, expected)
+
+
+def test_create_grid_matrix_walkable_property(tmx_map):
+    islands = np.asarray(tmx_map.get_layer_by_name("Islands").data)
+    island_gid = int(islands[islands != 0][0])
+    tmx_map.tile_properties[island_gid] = {"walkable": False}
+    try:
+        grid_manager = GridManager(tmx_map, tile_size=16, layer_rules={"Sea": 1})
+    finally:
+        del tmx_map.tile_properties[island_gid]
+
+    np.testing.assert_array_equal(grid_manager.grid_matrix, np.where(islands == island_gid, 0, 1))
+
+
+def test_find_path_sees_grid_changes():
+    grid_manager = GridManager(grid_matrix=np.ones((3, 3), dtype=int), tile_size=16)
+    assert grid_manager.find_path((0, 0), (0, 2)) == [[0, 0], [0, 1], [0, 2]]
+
+    grid_manager.set_cell(0, 1, 0)
+    assert grid_manager.find_path((0, 0), (0, 2)) == [[0, 0], [1, 1], [0, 2]]
+
+    grid_manager.grid_matrix = np.zeros((3, 3), dtype=int)
+    assert grid_manager.find_path((0, 0), (0, 2)) == []
+
+
+def test_coordinate_labels_are_rendered_lazily():
+    grid_manager = GridManager(grid_matrix=np.ones((100, 100), dtype=int), tile_size=16)
+    grid_manager.LABEL_CACHE_SIZE = 4
+    assert len(grid_manager.coordinate_surfaces) == 0
+
+    first = grid_manager._get_coordinate_surface(0, 0)
+    assert grid_manager._get_coordinate_surface(0, 0) is first
+    for x in range(1, 5):
+        grid_manager._get_coordinate_surface(x, 0)
+
+    assert len(grid_manager.coordinate_surfaces) == 4
+    assert (0, 0) not in grid_manager.coordinate_surfaces
+
+
+def test_grid_overlay_matches_per_tile_rects():
+    grid_manager = GridManager(grid_matrix=np.ones((10, 10), dtype=int), tile_size=16)
+    grid_manager.display_surface = pygame.Surface((400, 400))
+    offset, scale = pygame.math.Vector2(30, 40), 2.0
+    grid_manager._draw_grid_lines(0, 0, 4, 3, offset, scale)
+
+    expected = pygame.Surface((400, 400))
+    for y in range(3):
+        for x in range(4):
+            screen_x, screen_y = grid_manager._convert_to_screen_coordinates(x, y, offset, scale)
+            pygame.draw.rect(expected, "dark grey", pygame.Rect(screen_x, screen_y, 32, 32), 1)
+    for x, y in [(30, 40), (30 + 127, 40 + 95), (30 + 32, 40 + 5), (29, 40)]:
+        assert grid_manager.display_surface.get_at((x, y)) == expected.get_at((x, y))
+
+    overlay = grid_manager._get_grid_overlay(scale, 4)
+    assert grid_manager._get_grid_overlay(scale, 4) is overlay
+    assert grid_manager._get_grid_overlay(1.0, 4) is not overlay
+
+
 def test_manual_inspect_grid_manager(grid_manager):
     """Creates a pygame window to see the grid manager visually."""
     import time
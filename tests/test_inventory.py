@@ -4,11 +4,15 @@ import sys
 # Add the project root to sys.path to allow imports to work when running tests directly with `python`.
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+import json
+from types import SimpleNamespace
+from typing import cast
 
 import pytest
 
-from src.inventory import Chest, Inventory, Quest
-from src.utils.messaging import get_message
+from src.inventory import Chest, Inventory, Quest, ResultCode
+from src.states.game_running import GameRunning
+from src.utils.messaging import ERROR_MESSAGE, MessageCatalog, get_message
 
 # Old way of writing tests using unittest
 # class TestInventory(unittest.TestCase):
@@ -122,3 +126,75 @@ def test_get_quests(inventory):
     quests = inventory.get_quests()
     assert len(quests) == 1
     assert quests is not inventory.quests  # Copy of items
+
+
+# Test result codes
+def test_result_codes(inventory):
+    """Test that operations report a result code along with the message."""
+    assert inventory.add_item("Potion", 1).code is ResultCode.ADD_SUCCESS
+    assert inventory.use_item("Potion").code is ResultCode.USE_SUCCESS
+    result = inventory.use_item("Potion")
+    assert result.code is ResultCode.USE_FAIL and not result.success
+    assert inventory.sell_item("Potion", 1).code is ResultCode.SELL_FAIL
+
+
+# Test the message catalog
+def test_message_catalog_reloads_when_file_changes(tmp_path):
+    """Test that the catalog reads the file once, and again only after it changed."""
+    path = tmp_path / "messages.json"
+    path.write_text('{"inventory": {"use_success": "Used {item}."}}', encoding="utf-8")
+    catalog = MessageCatalog(str(path), reload_interval=0)
+    assert catalog.get("inventory", "use_success", item="Potion") == "Used Potion."
+    assert catalog.get("inventory", "missing") == ERROR_MESSAGE
+
+    path.write_text('{"inventory": {"use_success": "Drank {item}."}}', encoding="utf-8")
+    os.utime(path, (0, os.path.getmtime(path) + 10))
+    assert catalog.get("inventory", "use_success", item="Potion") == "Drank Potion."
+
+
+# Test apply_changes
+def test_apply_changes(inventory):
+    """Test applying several changes in one batch."""
+    inventory.add_item("Potion", 2)
+    result = inventory.apply_changes([("Potion", -2), ("Sword", 1), ("Gold", 5), ("Gold", -1)])
+    assert result.code is ResultCode.BATCH_SUCCESS
+    assert result == get_message("inventory", "batch_success", count=3)
+    assert inventory.items == {"Sword": 1, "Gold": 4}
+
+
+def test_apply_changes_is_all_or_nothing(inventory):
+    """Test that a batch with an invalid removal changes nothing."""
+    inventory.add_item("Potion", 1)
+    result = inventory.apply_changes({"Sword": 1, "Potion": -2})
+    assert result.code is ResultCode.BATCH_FAIL
+    assert result == get_message("inventory", "batch_fail", item="Potion")
+    assert inventory.items == {"Potion": 1}
+
+
+def test_apply_changes_ignores_net_zero_deltas(inventory):
+    """Test that changes cancelling out do not store an empty item."""
+    inventory.add_item("Potion", 1)
+    result = inventory.apply_changes([("Gold", 1), ("Gold", -1), ("Sword", 0), ("Potion", 0), ("Map", 2)])
+    assert result == get_message("inventory", "batch_success", count=1)
+    assert inventory.items == {"Potion": 1, "Map": 2}
+
+
+def test_apply_changes_rejects_non_integer_quantities(inventory):
+    """Test that a quantity which is not a whole number changes nothing."""
+    result = inventory.apply_changes([("Sword", 1), ("Potion", "2")])
+    assert result.code is ResultCode.BATCH_INVALID and not result.success
+    assert result == get_message("inventory", "batch_invalid", item="Potion")
+    assert inventory.items == {}
+
+
+@pytest.mark.parametrize("quantity", [-1, 1.5, "3"])
+def test_inventory_json_with_an_invalid_entry_is_reported(inventory, tmp_path, capsys, quantity):
+    """Test that one bad entry of inventory.json loads nothing and names the item."""
+    path = tmp_path / "inventory.json"
+    path.write_text(json.dumps({"Sword": {"quantity": 2}, "Potion": {"quantity": quantity}}), encoding="utf-8")
+
+    game = cast(GameRunning, SimpleNamespace(player_inventory=inventory))
+    GameRunning.load_inventory_from_json(game, str(path))
+
+    assert inventory.items == {}
+    assert "Potion" in capsys.readouterr().out
@@ -0,0 +1,78 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+import pytest
+
+from src.inventory import Inventory
+from src.states.paused import Paused
+from src.utils.profiler import profiler
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_init():
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def paused():
+    inventory = Inventory()
+    inventory.apply_changes((f"Item {index}", 1) for index in range(15))
+    return Paused(None, inventory)
+
+
+def test_unchanged_frames_are_not_redrawn(paused):
+    screen = pygame.display.get_surface()
+    paused.render(screen)
+    assert paused.dirty_rects == [paused.screen.get_rect()]
+
+    paused.render(screen)
+    assert paused.dirty_rects == []
+
+
+def test_only_changed_areas_are_updated(paused):
+    screen = pygame.display.get_surface()
+    paused.render(screen)
+
+    paused.update([pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1)])
+    paused.render(screen)
+    assert paused.dirty_rects == [paused._list_rect()]
+
+    paused.message, paused.message_end_time = "Hello", pygame.time.get_ticks() + 1000
+    paused.render(screen)
+    assert paused.dirty_rects == [paused._message_rect]
+
+    paused.message_end_time = 0  # the message timed out
+    previous_message_rect = paused._message_rect
+    paused.render(screen)
+    assert paused.dirty_rects == [previous_message_rect]
+
+
+def test_profiler_overlay_is_repainted_over_unchanged_frames(paused, monkeypatch):
+    screen = pygame.display.get_surface()
+    assert screen is not None
+    monkeypatch.setattr(profiler, "visible", True)
+    monkeypatch.setattr(profiler, "drawn_rect", None)
+
+    def area(surface, rect):
+        return pygame.image.tobytes(surface.subsurface(rect), "RGB")
+
+    frames = []
+    for _ in range(2):  # like the game loop: the state, then the overlay on top of it
+        paused.render(screen)
+        overlay_rect = profiler.draw(screen)
+        frames.append(area(screen, overlay_rect))
+    assert paused.dirty_rects == []  # nothing changed in the list
+    assert frames[0] == frames[1]  # the overlay did not get darker
+    assert frames[0] != area(paused.screen, overlay_rect)
+
+    profiler.visible = False
+    paused.render(screen)
+    assert profiler.draw(screen) is None
+    assert area(screen, overlay_rect) == area(paused.screen, overlay_rect)  # the last overlay was erased
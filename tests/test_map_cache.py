@@ -0,0 +1,90 @@
+import os
+import shutil
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pygame
+import pytest
+from pytmx.util_pygame import load_pygame
+
+from src.sprites.tiles import map_cache
+from src.sprites.tiles.grid_manager import GridManager
+from src.sprites.tiles.map_cache import load_map
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_init():
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def tmx_path(tmp_path):
+    # Copy the map and its tilesets, keeping the relative paths between them
+    shutil.copytree(os.path.join(DATA_DIR, "new_maps"), tmp_path / "data" / "new_maps")
+    shutil.copytree(os.path.join(DATA_DIR, "tilesets"), tmp_path / "data" / "tilesets")
+    shutil.copytree(os.path.join(DATA_DIR, "..", "images", "tilesets"), tmp_path / "images" / "tilesets")
+    return str(tmp_path / "data" / "new_maps" / "100x100_map.tmx")
+
+
+def test_compiled_map_matches_pytmx(tmx_path, tmp_path):
+    compiled = load_map(tmx_path, str(tmp_path / "cache"))
+    tmx_map = load_pygame(tmx_path)
+
+    assert (compiled.width, compiled.height) == (tmx_map.width, tmx_map.height)
+    np.testing.assert_array_equal(compiled.walkable, GridManager(tmx_map).grid_matrix)
+    for name in ("Sea", "Islands", "Shop"):
+        expected = list(tmx_map.get_layer_by_name(name).tiles())
+        tiles = list(compiled.get_layer_by_name(name).tiles())
+        assert [(x, y) for x, y, _ in tiles] == [(x, y) for x, y, _ in expected]
+        x, y, image = tiles[-1]
+        assert image.get_at((8, 8)) == expected[-1][2].get_at((8, 8))
+
+    ships = compiled.get_layer_by_name("Ships")
+    assert [obj.properties["pos"] for obj in ships] == [
+        obj.properties["pos"] for obj in tmx_map.get_layer_by_name("Ships")
+    ]
+
+
+def test_cache_is_reused_until_the_map_changes(tmx_path, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    load_map(tmx_path, cache_dir)
+
+    compiled = []
+    compile_map = map_cache.compile_map
+
+    def recording_compile_map(*args):
+        compiled.append(args)
+        return compile_map(*args)
+
+    monkeypatch.setattr(map_cache, "compile_map", recording_compile_map)
+
+    load_map(tmx_path, cache_dir)
+    # A newer mtime with the same content only refreshes the manifest
+    os.utime(tmx_path, (0, os.path.getmtime(tmx_path) + 10))
+    load_map(tmx_path, cache_dir)
+    assert compiled == []
+
+    with open(tmx_path, "a", encoding="utf-8") as file:
+        file.write("\n")
+    load_map(tmx_path, cache_dir)
+    assert len(compiled) == 1
+
+
+def test_cache_is_rebuilt_when_the_walkability_rules_change(tmx_path, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    before = np.array(load_map(tmx_path, cache_dir).walkable)
+
+    monkeypatch.setattr(GridManager, "LAYER_RULES", {"Sea": 0, "Islands": 0, "Shallow Sea": 1})
+    compiled = load_map(tmx_path, cache_dir)
+
+    expected = GridManager(load_pygame(tmx_path)).grid_matrix
+    np.testing.assert_array_equal(compiled.walkable, expected)
+    assert not np.array_equal(before, expected)
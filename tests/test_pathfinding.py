@@ -0,0 +1,366 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pytest
+from pathfinding.core.diagonal_movement import DiagonalMovement
+from pathfinding.core.grid import Grid
+from pathfinding.finder.a_star import AStarFinder
+
+from src.sprites.tiles.pathfinding import (
+    AStarEngine,
+    Coordinate,
+    FlowField,
+    HPAStarEngine,
+    JPSPlusEngine,
+    PathCache,
+    PathFinder,
+)
+
+
+def reference_cost(grid_matrix, start, end, diagonal_movement) -> float | None:
+    """Cost of the path found by the python-pathfinding A*, or None if there is no path."""
+    grid = Grid(matrix=grid_matrix)
+    finder = AStarFinder(diagonal_movement=diagonal_movement)
+    path, _ = finder.find_path(grid.node(*start), grid.node(*end), grid)
+    if not path:
+        return None
+    engine = AStarEngine(grid_matrix, diagonal_movement)
+    return engine.path_cost([(node.x, node.y) for node in path])
+
+
+def random_grid(seed: int, size: int = 20, obstacles: float = 0.3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) > obstacles).astype(int)
+    grid[0, 0] = grid[-1, -1] = 1
+    return grid
+
+
+@pytest.mark.parametrize(
+    "diagonal_movement",
+    [
+        DiagonalMovement.always,
+        DiagonalMovement.never,
+        DiagonalMovement.only_when_no_obstacle,
+        DiagonalMovement.if_at_most_one_obstacle,
+    ],
+)
+@pytest.mark.parametrize("seed", range(5))
+def test_costs_match_python_pathfinding(seed, diagonal_movement):
+    grid = random_grid(seed)
+    engine = AStarEngine(grid, diagonal_movement)
+    rng = np.random.default_rng(seed + 100)
+    start = (0, 0)
+    for _ in range(10):
+        x, y = rng.integers(0, 20, size=2)
+        end = (int(x), int(y))
+        path = engine.find_path(start, end)
+        expected = reference_cost(grid, start, end, diagonal_movement)
+        if expected is None:
+            assert path == []
+        else:
+            assert path[0] == start and path[-1] == end
+            assert engine.path_cost(path) == pytest.approx(expected)
+
+
+def test_weighted_cells_are_avoided():
+    grid = np.ones((3, 5), dtype=int)
+    grid[1, 1:4] = 10  # expensive middle row
+    engine = AStarEngine(grid, DiagonalMovement.never)
+    path = engine.find_path((0, 1), (4, 1))
+    assert all(y != 1 for x, y in path[1:-1])
+
+
+def test_search_state_is_reused_for_the_same_start():
+    engine = AStarEngine(np.ones((30, 30), dtype=int))
+    engine.find_path((0, 0), (29, 29))
+    expanded = engine.expanded_nodes
+
+    # The diagonal was already closed by the first query, no new expansion needed
+    assert engine.find_path((0, 0), (15, 15)) == [(i, i) for i in range(16)]
+    assert engine.expanded_nodes == expanded
+
+    # A new target continues from the existing frontier and still finds an optimal path
+    path = engine.find_path((0, 0), (29, 0))
+    assert engine.path_cost(path) == pytest.approx(29)
+
+
+def test_unreachable_and_out_of_bounds():
+    grid = np.ones((5, 5), dtype=int)
+    grid[:, 2] = 0  # wall splitting the grid
+    engine = AStarEngine(grid)
+    assert engine.find_path((0, 0), (4, 4)) == []
+    assert engine.find_path((0, 0), (2, 2)) == []
+    assert engine.find_path((0, 0), (9, 9)) == []
+    assert engine.find_path((1, 1), (1, 1)) == [(1, 1)]
+
+
+def test_path_finder_returns_coordinate_lists():
+    path_finder = PathFinder(np.ones((4, 4), dtype=int))
+    assert path_finder.find_path((0, 0), (3, 3)) == [[0, 0], [1, 1], [2, 2], [3, 3]]
+
+
+def test_path_cache_evicts_least_recently_used():
+    cache = PathCache(max_size=2)
+    a, b, c = Coordinate(0, 0), Coordinate(1, 1), Coordinate(2, 2)
+    cache.update_cache(a, b, [a, b])
+    cache.update_cache(a, c, [a, b, c])
+    assert cache.get_cached_path(a, b) == (a, b)  # (a, b) is now the most recent
+
+    cache.update_cache(b, c, [b, c])
+
+    assert cache.get_cached_path(a, c) is None
+    assert cache.get_cached_path(a, b) is not None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_path_cache_keys_on_movement_and_grid_version():
+    cache = PathCache()
+    a, b = Coordinate(0, 0), Coordinate(1, 1)
+    cache.update_cache(a, b, [a, b], movement=DiagonalMovement.always, grid_version=1)
+
+    assert cache.get_cached_path(a, b, DiagonalMovement.never, 1) is None
+    assert cache.get_cached_path(a, b, DiagonalMovement.always, 2) is None
+    assert cache.get_cached_path(a, b, DiagonalMovement.always, 1) == (a, b)
+
+
+def test_path_finder_serves_alternating_targets_from_cache():
+    path_finder = PathFinder(np.ones((10, 10), dtype=int))
+    for _ in range(3):
+        path_finder.find_path((0, 0), (9, 9))
+        path_finder.find_path((0, 0), (9, 0))
+    assert path_finder.cache_info() == {"hits": 4, "misses": 2, "size": 2}
+
+
+def test_path_finder_invalidates_cache_when_grid_changes():
+    path_finder = PathFinder(np.ones((3, 3), dtype=int))
+    assert path_finder.find_path((0, 0), (2, 0)) == [[0, 0], [1, 0], [2, 0]]
+
+    path_finder.set_cell(1, 0, 0)
+
+    assert path_finder.find_path((0, 0), (2, 0)) == [[0, 0], [1, 1], [2, 0]]
+
+
+@pytest.mark.parametrize(
+    "diagonal_movement",
+    [
+        DiagonalMovement.always,
+        DiagonalMovement.never,
+        DiagonalMovement.only_when_no_obstacle,
+        DiagonalMovement.if_at_most_one_obstacle,
+    ],
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_flow_field_costs_match_a_star(seed, diagonal_movement):
+    rng = np.random.default_rng(seed + 200)
+    grid = random_grid(seed) * rng.integers(1, 4, size=(20, 20))  # weighted cells
+    destination = (19, 19)
+    field = FlowField(grid, destination, diagonal_movement)
+    for _ in range(20):
+        x, y = rng.integers(0, 20, size=2)
+        start = (int(x), int(y))
+        engine = AStarEngine(grid, diagonal_movement)
+        expected = engine.find_path(start, destination)
+        path = field.path(start)
+        if not expected:
+            assert path == [] and field.next_step(start) is None
+        else:
+            assert path[0] == start and path[-1] == destination
+            assert engine.path_cost(path) == pytest.approx(engine.path_cost(expected))
+            assert field.distance[start[1], start[0]] == pytest.approx(engine.path_cost(expected))
+
+
+def test_flow_field_steps_of_a_fleet():
+    grid = np.ones((5, 5), dtype=int)
+    grid[1:4, 2] = 0  # wall in the middle, open at the top and bottom rows
+    field = FlowField(grid, (4, 2))
+
+    assert field.next_step((4, 2)) is None
+    assert field.next_step((9, 9)) is None
+    assert field.next_step((3, 2)) == (4, 2)
+    tiles = np.array([(0, 2), (3, 2), (4, 2), (1, 0)])
+    steps = field.next_steps(tiles)
+    assert steps.tolist() == [list(field.next_step(tuple(tile)) or tile) for tile in tiles.tolist()]
+
+
+def test_flow_field_of_unreachable_destination():
+    grid = np.ones((3, 3), dtype=int)
+    grid[1, 1] = 0
+    field = FlowField(grid, (1, 1))
+    assert field.path((0, 0)) == []
+    assert field.path((1, 1)) == [(1, 1)]
+    assert (field.direction == -1).all()
+
+
+def test_path_finder_caches_flow_fields_per_grid():
+    path_finder = PathFinder(np.ones((3, 3), dtype=int), flow_field_cache_size=2)
+    field = path_finder.flow_field((2, 0))
+    assert path_finder.flow_field((2, 0)) is field
+    assert field.path((0, 0)) == [(0, 0), (1, 0), (2, 0)]
+
+    path_finder.flow_field((0, 2))
+    path_finder.flow_field((1, 1))
+    assert path_finder.flow_field((2, 0)) is not field  # evicted as the least recently used
+
+    path_finder.set_cell(1, 0, 0)
+    assert path_finder.flow_field((2, 0)).path((0, 0)) == [(0, 0), (1, 1), (2, 0)]
+
+
+def test_flow_fields_computed_together_match_single_ones():
+    grid = random_grid(7)
+    destinations = [(0, 0), (19, 19), (5, 12), (30, 30)]
+    fields = FlowField.many(grid, destinations, DiagonalMovement.only_when_no_obstacle)
+    for destination, field in zip(destinations, fields):
+        single = FlowField(grid, destination, DiagonalMovement.only_when_no_obstacle)
+        assert np.array_equal(field.distance, single.distance)
+        assert np.array_equal(field.direction, single.direction)
+
+
+def is_valid_path(grid, path, diagonal_movement) -> bool:
+    """Whether every step of `path` goes to a neighbor allowed by the diagonal movement rule."""
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        dx, dy = x1 - x0, y1 - y0
+        if max(abs(dx), abs(dy)) != 1 or grid[y1, x1] <= 0:
+            return False
+        if dx and dy:
+            corners = (grid[y0, x1] > 0, grid[y1, x0] > 0)
+            if diagonal_movement == DiagonalMovement.never:
+                return False
+            if diagonal_movement == DiagonalMovement.only_when_no_obstacle and not all(corners):
+                return False
+            if diagonal_movement == DiagonalMovement.if_at_most_one_obstacle and not any(corners):
+                return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "diagonal_movement",
+    [
+        DiagonalMovement.always,
+        DiagonalMovement.never,
+        DiagonalMovement.only_when_no_obstacle,
+        DiagonalMovement.if_at_most_one_obstacle,
+    ],
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_hierarchical_paths_are_valid_and_near_optimal(seed, diagonal_movement):
+    rng = np.random.default_rng(seed + 300)
+    grid = (rng.random((30, 37)) > 0.3).astype(int) * rng.integers(1, 3, size=(30, 37))
+    engine = AStarEngine(grid, diagonal_movement)
+    hierarchical = HPAStarEngine(grid, diagonal_movement, cluster_size=6)
+    for _ in range(30):
+        start = (int(rng.integers(37)), int(rng.integers(30)))
+        end = (int(rng.integers(37)), int(rng.integers(30)))
+        expected = engine.find_path(start, end)
+        path = hierarchical.find_path(start, end)
+        if not expected:
+            assert path == []
+        else:
+            assert path[0] == start and path[-1] == end
+            assert is_valid_path(grid, path, diagonal_movement)
+            assert engine.path_cost(expected) <= hierarchical.path_cost(path) <= 1.5 * engine.path_cost(expected)
+
+
+def test_hierarchical_short_routes_are_optimal():
+    grid = np.ones((64, 64), dtype=int)
+    hierarchical = HPAStarEngine(grid)
+    assert hierarchical.find_path((3, 4), (9, 4)) == [(x, 4) for x in range(3, 10)]  # same cluster
+    assert hierarchical.find_path((8, 15), (8, 16)) == [(8, 15), (8, 16)]  # adjacent clusters
+
+    grid = random_grid(5, size=64, obstacles=0.2)
+    engine = AStarEngine(grid)
+    hierarchical = HPAStarEngine(grid)
+    rng = np.random.default_rng(5)
+    for x, y, dx, dy in rng.integers((0, 0, -20, -20), (64, 64, 21, 21), size=(40, 4)).tolist():
+        start, end = (x, y), (min(max(x + dx, 0), 63), min(max(y + dy, 0), 63))
+        expected = engine.find_path(start, end)
+        path = hierarchical.find_path(start, end)
+        assert bool(path) == bool(expected)
+        if expected:
+            assert hierarchical.path_cost(path) == pytest.approx(engine.path_cost(expected))
+
+
+def test_hierarchical_graph_is_updated_incrementally():
+    grid = random_grid(3, size=24)
+    hierarchical = HPAStarEngine(grid, cluster_size=5)
+    rng = np.random.default_rng(4)
+    for x, y in rng.integers(0, 24, size=(10, 2)).tolist():
+        grid[y, x] = 1 - grid[y, x]
+        hierarchical.set_cell(x, y, grid[y, x])
+        assert hierarchical.graph == HPAStarEngine(grid, cluster_size=5).graph
+
+
+def test_path_finder_algorithm_mode():
+    grid = np.ones((40, 40), dtype=int)
+    grid[5:, 20] = 0  # wall open at the top only
+    path_finder = PathFinder(grid, algorithm="hpa")
+    path = path_finder.find_path((0, 20), (39, 20))
+    assert path[0] == [0, 20] and path[-1] == [39, 20]
+    assert [y for x, y in path if x == 20] and all(y < 5 for x, y in path if x == 20)
+
+    for y in range(5):
+        path_finder.set_cell(20, y, 0)
+    assert path_finder.find_path((0, 20), (39, 20)) == []
+
+    path_finder.algorithm = "a_star"
+    assert path_finder.cache_info()["size"] == 0
+    with pytest.raises(ValueError):
+        path_finder.algorithm = "dijkstra"
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_jump_point_costs_match_python_pathfinding(seed):
+    rng = np.random.default_rng(seed + 400)
+    grid = random_grid(seed, size=25, obstacles=rng.uniform(0.05, 0.4))
+    engine = JPSPlusEngine(grid)
+    for _ in range(15):
+        x, y = rng.integers(0, 25, size=2)
+        start = (int(x), int(y))
+        x, y = rng.integers(0, 25, size=2)
+        end = (int(x), int(y))
+        path = engine.find_path(start, end)
+        expected = reference_cost(grid, start, end, DiagonalMovement.always)
+        if expected is None:
+            assert path == []
+        else:
+            assert path[0] == start and path[-1] == end
+            assert is_valid_path(grid, path, DiagonalMovement.always)
+            assert AStarEngine(grid).path_cost(path) == pytest.approx(expected)
+
+
+def test_jump_point_search_expands_fewer_nodes_on_open_sea():
+    grid = np.ones((60, 60), dtype=int)
+    grid[10:20, 25:28] = grid[35:50, 40:45] = 0  # a few islands
+    a_star, jump_point = AStarEngine(grid), JPSPlusEngine(grid)
+    for start, end in [((0, 0), (59, 59)), ((0, 59), (59, 0)), ((5, 30), (55, 30))]:
+        a_star._reset(None)
+        path = jump_point.find_path(start, end)
+        assert a_star.path_cost(path) == pytest.approx(a_star.path_cost(a_star.find_path(start, end)))
+    assert jump_point.expanded_nodes * 10 < a_star.expanded_nodes
+
+
+def test_jump_point_tables_follow_grid_changes():
+    engine = JPSPlusEngine(np.ones((5, 5), dtype=int))
+    assert engine.find_path((0, 2), (4, 2)) == [(x, 2) for x in range(5)]
+
+    for y in range(5):
+        engine.set_cell(2, y, 0)
+    assert engine.find_path((0, 2), (4, 2)) == []
+
+    engine.set_cell(2, 0, 1)
+    path = engine.find_path((0, 2), (4, 2))
+    assert (2, 0) in path and len(path) == 5
+
+
+def test_path_finder_uses_a_star_on_weighted_grids_in_jps_mode():
+    grid = np.ones((3, 5), dtype=int)
+    path_finder = PathFinder(grid, algorithm="jps")
+    assert path_finder.find_path((0, 1), (4, 1)) == [[x, 1] for x in range(5)]
+
+    for x in range(1, 4):
+        path_finder.set_cell(x, 1, 10)  # expensive middle row, jump point search would not be optimal
+    assert path_finder.jump_point is not None and not path_finder.jump_point.uniform
+    assert all(y != 1 for _, y in path_finder.find_path((0, 1), (4, 1))[1:-1])
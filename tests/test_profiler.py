@@ -0,0 +1,65 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import csv
+
+import pygame
+import pytest
+
+from src.utils.profiler import FrameProfiler
+
+
+def record_frames(profiler, count):
+    for _ in range(count):
+        profiler.begin_frame()
+        with profiler.section("update"):
+            pass
+        profiler.end_frame()
+
+
+def test_ring_buffer_keeps_the_last_frames():
+    profiler = FrameProfiler(capacity=4)
+    record_frames(profiler, 3)
+    assert profiler.samples().size == 3
+
+    record_frames(profiler, 3)
+    profiler.begin_frame()
+    profiler.current["frame_marker"] = 1.0  # a section seen for the first time
+    profiler.end_frame()
+
+    assert profiler.count == 7
+    assert profiler.samples("update").size == 4
+    assert profiler.samples("frame_marker").tolist() == [0, 0, 0, 1000]
+
+
+def test_percentiles():
+    profiler = FrameProfiler(capacity=100)
+    profiler.history["frame"][:] = range(1, 101)
+    profiler.count = 100
+    assert profiler.percentiles() == pytest.approx({"p50": 50.5, "p95": 95.05, "p99": 99.01})
+
+
+def test_dump_csv(tmp_path):
+    profiler = FrameProfiler(capacity=8)
+    record_frames(profiler, 5)
+    path = profiler.dump_csv(str(tmp_path / "frames.csv"))
+
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["frame_ms", "update_ms"]
+    assert len(rows) == 6
+
+
+def test_overlay_is_drawn_only_when_visible():
+    pygame.init()
+    surface = pygame.Surface((320, 240))
+    profiler = FrameProfiler()
+    record_frames(profiler, 10)
+
+    assert profiler.draw(surface) is None
+    profiler.visible = True
+    area = profiler.draw(surface)
+    assert area is not None and area.width == FrameProfiler.GRAPH_SIZE[0]
@@ -0,0 +1,94 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pygame
+import pytest
+
+from src.inventory import Chest, Inventory, Quest
+from src.sprites.entities.player import Player
+from src.utils.save_game import GameSnapshot, SaveError, SaveManager, decode_snapshot, encode_snapshot
+
+
+class FakePlayer:
+    def __init__(self) -> None:
+        self.rect = pygame.FRect(32, 48, 16, 16)
+        self.path = [[3, 3], [4, 4]]
+
+    @property
+    def waypoints(self):
+        return self.path
+
+
+class FakeGridManager:
+    def __init__(self) -> None:
+        self.grid_matrix = np.ones((4, 5), dtype=int)
+
+
+@pytest.fixture
+def snapshot():
+    inventory = Inventory()
+    inventory.money = 120
+    inventory.apply_changes({"Potion": 2, "Gold Coin": 7})
+    inventory.add_chest(Chest("Gold Chest"))
+    quest = Quest()
+    quest.completed = True
+    inventory.add_quest(quest)
+    grid_manager = FakeGridManager()
+    grid_manager.grid_matrix[1, 2] = 0
+    return GameSnapshot.capture(FakePlayer(), inventory, grid_manager, show_grid=False)
+
+
+def test_encode_decode_round_trip(snapshot):
+    decoded = decode_snapshot(encode_snapshot(snapshot))
+
+    assert decoded.player_pos == (32, 48)
+    assert decoded.player_path == [(3, 3), (4, 4)]
+    assert (decoded.money, decoded.items) == (120, {"Potion": 2, "Gold Coin": 7})
+    assert (decoded.chests, decoded.quests, decoded.show_grid) == (["Gold Chest"], [True], False)
+    np.testing.assert_array_equal(decoded.grid_matrix, snapshot.grid_matrix)
+
+
+def test_invalid_data_is_rejected(snapshot):
+    data = encode_snapshot(snapshot)
+    with pytest.raises(SaveError):
+        decode_snapshot(b"NOPE" + data[4:])
+    with pytest.raises(SaveError):
+        decode_snapshot(data[:-1] + bytes([data[-1] ^ 1]))
+    with pytest.raises(SaveError):
+        decode_snapshot(data[:5])
+
+
+def test_quick_save_and_restore(snapshot, tmp_path):
+    path = str(tmp_path / "saves" / "quicksave.sav")
+    save_manager = SaveManager()
+    save_manager.save(snapshot, path)
+    loaded = save_manager.load(path)
+    save_manager.shutdown()
+
+    player, inventory, grid_manager = FakePlayer(), Inventory(), FakeGridManager()
+    player.path = []
+    loaded.restore(player, inventory, grid_manager)
+
+    assert player.rect.topleft == (32, 48) and player.path == [[3, 3], [4, 4]]
+    assert inventory.items == {"Potion": 2, "Gold Coin": 7} and inventory.quests[0].completed
+    assert grid_manager.grid_matrix[1, 2] == 0
+
+
+def test_restored_ship_resumes_towards_its_current_tile():
+    player = Player((0, 0), [pygame.Surface((16, 16))])
+    player.path = [(1, 0), (1, 1), (2, 1)]
+    player.update(0.5 / player.movement.speed[player.ship])  # half way to (1, 0)
+    assert list(player.path) == [(1, 1), (2, 1)]
+
+    snapshot = decode_snapshot(encode_snapshot(GameSnapshot.capture(player, Inventory())))
+    assert snapshot.player_path == [(1, 0), (1, 1), (2, 1)]
+
+    restored = Player((0, 0), [pygame.Surface((16, 16))])
+    snapshot.restore(restored, Inventory())
+    restored.update(1 / restored.movement.speed[restored.ship])  # reaches the corner, then heads down
+    assert restored.rect.topleft == pytest.approx((16, 8))
+    assert list(restored.path) == [(2, 1)]
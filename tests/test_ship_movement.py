@@ -0,0 +1,98 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from types import SimpleNamespace
+from typing import cast
+
+import numpy as np
+import pygame
+import pytest
+
+from src.sprites.entities.ship_movement import ShipMovement
+
+
+def sail(movement, seconds, steps):
+    for _ in range(steps):
+        movement.update(seconds / steps)
+
+
+def test_speed_is_in_tiles_per_second():
+    movement = ShipMovement(tile_size=16)
+    ship = movement.add((0, 0), speed=4)
+    movement.set_path(ship, [(x, 0) for x in range(1, 11)])
+
+    sail(movement, 1.0, 60)
+    assert movement.position[ship] == pytest.approx((64, 0))  # 4 tiles, heading to the 5th
+    assert list(movement.path(ship)) == [(x, 0) for x in range(6, 11)]
+
+    sail(movement, 0.5, 60)
+    assert movement.position[ship] == pytest.approx((96, 0))
+
+
+def test_distance_does_not_depend_on_the_step():
+    positions = []
+    for steps in (7, 30, 240):
+        movement = ShipMovement(tile_size=16)
+        ship = movement.add((0, 0), speed=5)
+        movement.set_path(ship, [(1, 1), (2, 1), (3, 2), (3, 3), (4, 3)])
+        sail(movement, 0.5, steps)
+        positions.append(movement.position[ship].copy())
+
+    assert positions[0] == pytest.approx(positions[1]) and positions[1] == pytest.approx(positions[2])
+
+
+def test_fast_ships_go_through_several_waypoints_in_one_step():
+    movement = ShipMovement(tile_size=16)
+    ship = movement.add((0, 0), speed=100)
+    movement.set_path(ship, [(1, 0), (2, 0), (3, 0)])
+
+    movement.update(1 / 60)  # 1.67 tiles
+
+    assert movement.position[ship] == pytest.approx((16 * 100 / 60, 0))
+    assert list(movement.path(ship)) == [(3, 0)]
+
+    movement.update(1.0)
+    assert movement.position[ship] == pytest.approx((48, 0)) and not movement.moving[ship]
+
+
+def test_fleets_move_together_and_sprites_follow():
+    movement = ShipMovement(tile_size=16, capacity=4)
+    sprites = [SimpleNamespace(rect=pygame.FRect(16 * index, 0, 16, 16)) for index in range(300)]
+    ships = [
+        movement.add(sprite.rect.topleft, speed=2, sprite=cast(pygame.sprite.Sprite, sprite)) for sprite in sprites
+    ]
+    for ship, sprite in zip(ships, sprites):
+        movement.set_path(ship, [(ship, 1), (ship, 2)])
+
+    sail(movement, 1.0, 60)
+
+    assert len(movement) == 300
+    assert np.allclose(movement.position[: len(ships)], [(16 * ship, 32) for ship in ships])
+    assert all(sprite.rect.topleft == (16 * ship, 32) for ship, sprite in zip(ships, sprites))
+    assert not movement.moving.any()
+
+
+def test_paths_start_from_the_sprite():
+    movement = ShipMovement(tile_size=16)
+    sprite = SimpleNamespace(rect=pygame.FRect(0, 0, 16, 16))
+    ship = movement.add((0, 0), sprite=cast(pygame.sprite.Sprite, sprite))
+
+    sprite.rect.topleft = (160, 160)  # moved by hand, e.g. restored by a quick-load
+    movement.set_path(ship, [(10, 11)])
+    movement.update(1.0)
+
+    assert sprite.rect.topleft == (160, 176)
+
+
+def test_removed_ships_are_reused():
+    movement = ShipMovement(tile_size=16)
+    first = movement.add((0, 0))
+    movement.set_path(first, [(5, 5)])
+    movement.remove(first)
+
+    assert len(movement) == 0 and not movement.moving.any()
+    assert movement.add((32, 32)) == first
+    assert movement.position[first] == pytest.approx((32, 32))
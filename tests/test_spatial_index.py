@@ -0,0 +1,58 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+import pytest
+
+from src.sprites.camera.spatial_index import SpatialIndex
+
+
+def make_sprite(x: int, y: int, size: int = 16) -> pygame.sprite.Sprite:
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(x, y, size, size)
+    return sprite
+
+
+@pytest.fixture
+def tiles():
+    """A 20x20 grid of 16px tile sprites, in draw order."""
+    return [make_sprite(x * 16, y * 16) for y in range(20) for x in range(20)]
+
+
+def test_query_returns_only_nearby_sprites(tiles):
+    index = SpatialIndex(bucket_size=64)
+    index.build(tiles, tiles.index)
+
+    visible = [sprite for _, sprite in index.query(pygame.Rect(0, 0, 64, 64))]
+    assert len(visible) == 16  # a single 4x4 tiles bucket
+    assert all(sprite.rect is not None and sprite.rect.right <= 64 and sprite.rect.bottom <= 64 for sprite in visible)
+
+
+def test_query_is_sorted_by_draw_order(tiles):
+    order = {sprite: len(tiles) - i for i, sprite in enumerate(tiles)}  # reversed draw order
+    index = SpatialIndex(bucket_size=64)
+    index.build(tiles, order.__getitem__)
+
+    orders = [entry[0] for entry in index.query(pygame.Rect(0, 0, 200, 200))]
+    assert orders == sorted(orders)
+
+
+def test_spanning_sprite_is_returned_once():
+    big = make_sprite(56, 56, size=32)  # covers 4 buckets of 64 pixels
+    index = SpatialIndex(bucket_size=64)
+    index.build([big], lambda sprite: 0)
+
+    assert index.query(pygame.Rect(0, 0, 128, 128)) == [(0, big)]
+
+
+def test_remove(tiles):
+    index = SpatialIndex(bucket_size=64)
+    index.build(tiles, tiles.index)
+    index.remove(tiles[0])
+
+    assert tiles[0] not in index
+    assert len(index) == len(tiles) - 1
+    assert all(sprite is not tiles[0] for _, sprite in index.query(pygame.Rect(0, 0, 64, 64)))
@@ -0,0 +1,55 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+import pytest
+
+from src.sprites.tiles.static_layer import StaticTileLayer
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_init():
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.quit()
+
+
+def make_tile(color) -> pygame.Surface:
+    tile = pygame.Surface((16, 16))
+    tile.fill(color)
+    return tile
+
+
+def test_tiles_are_grouped_into_chunks():
+    red = make_tile("red")
+    tiles = [(x, y, red) for x in range(10) for y in range(5)]
+    layer = StaticTileLayer(tiles, map_size=(10, 5), chunk_size=4)
+
+    assert set(layer.chunks) == {(x, y) for x in range(3) for y in range(2)}
+    assert layer.chunks[(1, 1)].get_at((16, 0)) == pygame.Color("red")
+    # The map stops at row 4, the rest of the bottom chunks stays transparent
+    assert layer.chunks[(2, 1)].get_at((16, 0)) == pygame.Color("red")
+    assert layer.chunks[(2, 1)].get_at((16, 16)).a == 0
+
+
+def test_draw_blits_visible_chunks_scaled():
+    layer = StaticTileLayer([(0, 0, make_tile("blue"))], map_size=(2, 2), chunk_size=1)
+    surface = pygame.Surface((64, 64))
+
+    layer.draw(surface, pygame.math.Vector2(8, 8), 2.0, pygame.FRect(0, 0, 32, 32))
+
+    assert surface.get_at((8, 8)) == pygame.Color("blue")
+    assert surface.get_at((39, 39)) == pygame.Color("blue")
+    assert surface.get_at((40, 40)) == pygame.Color("black")
+
+
+def test_scaled_chunks_are_cached_per_scale():
+    layer = StaticTileLayer([(0, 0, make_tile("blue"))], map_size=(1, 1), chunk_size=1)
+
+    first = layer.get_scaled_chunk((0, 0), 2.0)
+    assert layer.get_scaled_chunk((0, 0), 2.0) is first
+    assert layer.get_scaled_chunk((0, 0), 3.0).get_size() == (48, 48)
@@ -0,0 +1,95 @@
+import os
+import sys
+from os.path import normpath
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+import pytest
+
+from src import support
+from src.states.base_state import BaseState
+from src.states.loading import Loading
+from src.support import cut_tilemap, decode_images, import_folder, preload_images
+
+
+@pytest.fixture
+def display():
+    pygame.init()
+    yield pygame.display.set_mode((64, 64))
+    pygame.quit()
+
+
+@pytest.fixture
+def frames_folder(tmp_path):
+    for index in range(12):
+        frame = pygame.Surface((8, 8))
+        frame.fill((index * 20, 0, 0))
+        pygame.image.save(frame, tmp_path / f"{index}.png")
+    return tmp_path
+
+
+def test_folders_are_decoded_in_order(display, frames_folder):
+    frames = import_folder(str(frames_folder))
+    assert [frame.get_at((0, 0)).r for frame in frames] == [index * 20 for index in range(12)]
+
+
+def test_preloaded_images_are_not_decoded_again(frames_folder, monkeypatch):
+    paths = [str(frames_folder / "0.png"), str(frames_folder / "1.png")]
+    futures = preload_images(paths)
+    for future in futures:
+        future.result()
+
+    def fail(*args):
+        raise AssertionError("the image was decoded again")
+
+    monkeypatch.setattr(pygame.image, "load", fail)
+    assert decode_images(paths) == [future.result() for future in futures]
+
+
+def test_tilemaps_are_cut_into_subsurfaces():
+    sheet = pygame.Surface((30, 20))
+    sheet.fill((0, 0, 255), (10, 10, 10, 10))
+    frames = cut_tilemap(sheet, 3, 2)
+
+    assert len(frames) == 6
+    assert all(frame.get_parent() is sheet and frame.get_size() == (10, 10) for frame in frames.values())
+    assert frames[(1, 1)].get_at((0, 0)) == (0, 0, 255)
+    assert frames[(0, 0)].get_abs_offset() == (0, 0) and frames[(2, 1)].get_abs_offset() == (20, 10)
+
+
+class FakeManager:
+    def __init__(self) -> None:
+        self.states_stack: list[BaseState] = []
+
+    def enter_state(self, state: BaseState) -> None:
+        self.states_stack.append(state)
+
+    def exit_state(self) -> BaseState:
+        return self.states_stack.pop()
+
+
+class ReadyState(BaseState):
+    def update(self, events) -> None:
+        pass
+
+    def render(self, screen) -> None:
+        pass
+
+
+def test_loading_replaces_itself_with_the_built_state(display, frames_folder):
+    manager = FakeManager()
+    paths = [str(frames_folder / f"{index}.png") for index in range(12)]
+    loading = Loading(manager, paths, lambda: ReadyState(manager))
+    manager.enter_state(loading)
+
+    for future in loading.futures:
+        future.result()
+    loading.update([])  # shows the complete progress bar for one frame
+    loading.render(display)
+    assert loading.progress == 1.0 and manager.states_stack == [loading]
+
+    loading.update([])
+    assert isinstance(manager.states_stack[-1], ReadyState) and len(manager.states_stack) == 1
+    assert not any(normpath(path) in support._decoding for path in paths)  # unused images are released
@@ -0,0 +1,66 @@
+import os
+import sys
+
+# Add the project root to sys.path to allow imports to work when running tests directly with `python`.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+import pytest
+
+from src.utils.text_cache import TextCache
+
+
+@pytest.fixture(autouse=True)
+def pygame_font():
+    pygame.font.init()
+    yield
+    pygame.font.quit()
+
+
+def test_repeated_text_is_rendered_once():
+    cache = TextCache()
+    first = cache.render("Use", (0, 0, 0))
+    assert cache.render("Use", (0, 0, 0)) is first
+    assert cache.render("Use", "black") is first  # same color, another spelling
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # Every part of the key matters
+    assert cache.render("Use", (255, 255, 255)) is not first
+    assert cache.render("Use", (0, 0, 0), size=18) is not first
+    assert cache.render("Use", (0, 0, 0), antialias=False) is not first
+    assert cache.misses == 4
+
+
+def test_least_recently_used_text_is_dropped():
+    cache = TextCache(capacity=2)
+    use = cache.render("Use", "white")
+    cache.render("Discard", "white")
+    cache.render("Use", "white")  # "Discard" is now the least recently used
+    cache.render("Buy", "white")
+
+    assert cache.render("Use", "white") is use
+    misses = cache.misses
+    cache.render("Discard", "white")
+    assert cache.misses == misses + 1
+
+
+def test_glyphs_are_reused_across_strings():
+    cache = TextCache()
+    surface = pygame.Surface((200, 50), pygame.SRCALPHA)
+    area = cache.blit_glyphs(surface, "x12", (10, 5), "white")
+    cache.blit_glyphs(surface, "x21", (10, 5), "white")
+
+    assert len(cache._glyphs) == 3
+    assert cache.misses == 0  # numbers never go through the string cache
+    assert area.topleft == (10, 5)
+    assert area.width == pytest.approx(cache.font().size("x12")[0], abs=2)
+    assert surface.get_bounding_rect().colliderect(area)
+
+
+def test_fonts_are_reloaded_after_pygame_quits():
+    cache = TextCache()
+    cache.render("Buy", "white")
+    pygame.font.quit()
+    pygame.font.init()
+    assert cache.font().get_linesize() > 0  # fonts handed out directly are reloaded too
+    assert cache.render("Sell", "white").get_width() > 0